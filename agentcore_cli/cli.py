@@ -100,10 +100,12 @@ def cli(ctx: click.Context, config: str | None = None, verbose: bool = False, qu
     # Configure logging based on flags
     if verbose:
         logger.remove()
+        # Debug level receives per-line command output (e.g. docker build), so write it from a background queue
         logger.add(
             sys.stderr,
             format="<green>{time:HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
             level="DEBUG",
+            enqueue=True,
         )
         ctx.obj["verbose"] = True
     elif quiet:
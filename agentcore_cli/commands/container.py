@@ -12,7 +12,7 @@ from agentcore_cli.services.ecr import ECRService
 from agentcore_cli.services.config import config_manager
 from agentcore_cli.models.inputs import ContainerBuildInput
 from agentcore_cli.utils.validation import validate_agent_name
-from agentcore_cli.utils.command_executor import execute_command
+from agentcore_cli.utils.command_executor import OUTPUT_TAIL_LINES, execute_command
 from agentcore_cli.utils.rich_utils import (
     print_success,
     print_error,
@@ -389,7 +389,9 @@ def pull_container(name: str, tag: str, region: str | None) -> None:
                 return
 
             # Pull the image
-            returncode, stdout, stderr = execute_command(["docker", "pull", full_image], log_cmd=True, log_output=False)
+            returncode, stdout, stderr = execute_command(
+                ["docker", "pull", full_image], log_cmd=True, log_output=False, max_output_lines=OUTPUT_TAIL_LINES
+            )
 
             if returncode == 0:
                 print_success("Image pulled successfully", full_image)
@@ -17,6 +17,10 @@ from agentcore_cli.utils.cfn_utils import CFNService
 class CognitoService:
     """Service for AWS Cognito operations."""
 
+    # Success message templates, exposed so callers and tests can match them exactly
+    MSG_USER_CREATED = "User '{username}' created successfully"
+    MSG_USER_DELETED = "User '{username}' deleted successfully"
+
     def __init__(self, region: str, session: Session | None = None):
         """Initialize the Cognito service.
 
@@ -452,7 +456,7 @@ class CognitoService:
                     UserPoolId=user_pool_id, Username=username, Password=password, Permanent=True
                 )
 
-            return True, f"User '{username}' created successfully"
+            return True, self.MSG_USER_CREATED.format(username=username)
 
         except Exception as e:
             error_msg = f"Failed to create user: {str(e)}"
@@ -472,7 +476,7 @@ class CognitoService:
         try:
             # Delete user
             self.cognito_idp_client.admin_delete_user(UserPoolId=user_pool_id, Username=username)
-            return True, f"User '{username}' deleted successfully"
+            return True, self.MSG_USER_DELETED.format(username=username)
 
         except Exception as e:
             error_msg = f"Failed to delete user: {str(e)}"
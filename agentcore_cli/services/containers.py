@@ -8,7 +8,7 @@ from boto3.session import Session
 from loguru import logger
 from typing import Any
 from agentcore_cli.services.config import config_manager
-from agentcore_cli.utils.command_executor import execute_command
+from agentcore_cli.utils.command_executor import OUTPUT_TAIL_LINES, execute_command
 
 
 class ContainerService:
@@ -193,8 +193,8 @@ class ContainerService:
             # Add context
             cmd.append(".")
 
-            # Execute the build command using our utility function
-            returncode, stdout, stderr = execute_command(cmd, check=False)
+            # Execute the build command using our utility function; only the output tail is kept
+            returncode, stdout, stderr = execute_command(cmd, check=False, max_output_lines=OUTPUT_TAIL_LINES)
 
             if returncode == 0:
                 logger.success(f"Docker image built successfully: {image_tag}")
@@ -18,6 +18,9 @@ from agentcore_cli.utils.validation import validate_repo_name
 class ECRService:
     """Service for AWS ECR operations."""
 
+    # Success message template, exposed so callers and tests can match it exactly
+    MSG_LIFECYCLE_POLICY_SET = "Lifecycle policy set on repository '{repository_name}'"
+
     def __init__(self, region: str, session: Session | None = None):
         """Initialize the ECR service.
 
@@ -341,7 +344,7 @@ class ECRService:
             # Apply the policy
             self.ecr_client.put_lifecycle_policy(repositoryName=repository_name, lifecyclePolicyText=policy_text)
 
-            return True, f"Lifecycle policy set on repository '{repository_name}'"
+            return True, self.MSG_LIFECYCLE_POLICY_SET.format(repository_name=repository_name)
 
         except self.ecr_client.exceptions.RepositoryNotFoundException:
             return False, f"Repository '{repository_name}' not found"
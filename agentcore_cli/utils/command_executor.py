@@ -7,20 +7,69 @@ proper error handling and security validation for AgentCore CLI use cases.
 The module is designed to be used as a utility for other modules in the AgentCore CLI.
 """
 
+import functools
 import subprocess  # nosec: B404
 import re
-from typing import Union
+import shlex
+import threading
+from collections import deque
+from typing import IO, Any, Union
 from loguru import logger
 
 
+# Tail length for commands whose output is only logged or reported on failure
+OUTPUT_TAIL_LINES = 512
+
+
+# Allowed command patterns for AgentCore CLI, in display order
+_DOCKER_SUBCOMMANDS = ("build", "tag", "push", "pull", "images", "inspect", "rmi", "buildx")
+_AWS_SUBCOMMANDS = ("--version", "ecr", "sts")
+
+_ALLOWED_SUBCOMMANDS: dict[str, frozenset[str]] = {
+    # Docker commands
+    "docker": frozenset(_DOCKER_SUBCOMMANDS),
+    # AWS CLI commands
+    "aws": frozenset(_AWS_SUBCOMMANDS),
+}
+_ALLOWED_BINARIES = frozenset(_ALLOWED_SUBCOMMANDS)
+
+# Constant parts of validation error messages
+_BINARIES_ALLOWED_STR = ", ".join(_ALLOWED_SUBCOMMANDS)
+_DOCKER_ALLOWED_STR = ", ".join(_DOCKER_SUBCOMMANDS)
+
+# ECR authentication is the only command allowed to contain a pipe; matched against the whole command
+_ECR_AUTH_PREFIX = ["aws", "ecr", "get-login-password"]
+_ECR_PATTERN = re.compile(
+    r"aws ecr get-login-password --region (?P<region>[\w-]+) \| "
+    r"docker login --username AWS --password-stdin (?P<registry>[\w.-]+\.dkr\.ecr\.[\w-]+\.amazonaws\.com)",
+    re.ASCII,
+)
+
+# Substrings that indicate shell metacharacters or pipelines in an argv element
+_DANGEROUS_CHARSET = ("$", "`", "&&", ";", "|")
+
+# Shell metacharacters that could indicate command injection, scanned in a single pass
+_DANGEROUS_RE = re.compile(r"[$`;]|&&")
+
+# Standalone 'rm' token (not part of other words like '--platform' or 'rmi')
+_RM_PATTERN = re.compile(r"\brm\b")
+
+
 def execute_command(
-    cmd: Union[list[str], str], check: bool = False, text: bool = True, log_cmd: bool = True, log_output: bool = True
+    cmd: Union[list[str], str],
+    check: bool = False,
+    text: bool = True,
+    log_cmd: bool = True,
+    log_output: bool = True,
+    max_output_lines: int | None = None,
 ) -> tuple[int, str, str]:
     """Execute a shell command and capture all output with security validation.
 
     This is a centralized utility to ensure all subprocess calls consistently capture
     stdout and stderr while maintaining proper error handling and security validation
-    for AgentCore CLI use cases.
+    for AgentCore CLI use cases. Output is streamed line by line as raw bytes while the
+    command runs, so memory can be bounded for chatty commands such as ``docker build``,
+    and only the retained output is decoded once the command finishes.
 
     Args:
         cmd: Command to execute, either as list of arguments or shell string
@@ -28,15 +77,15 @@ def execute_command(
         text: Whether to decode output as text (vs bytes)
         log_cmd: Whether to log the command being executed
         log_output: Whether to log command output
+        max_output_lines: If set, only the last N lines of each stream are kept and returned.
+            Use OUTPUT_TAIL_LINES for commands whose output is only logged or shown on error.
 
     Returns:
         Tuple[int, str, str]: (return_code, stdout, stderr)
     """
     if log_cmd:
-        if isinstance(cmd, list):
-            logger.info(f"Executing: {' '.join(cmd)}")
-        else:
-            logger.info(f"Executing: {cmd}")
+        # Only join argv when a sink will actually emit INFO
+        logger.opt(lazy=True).info("Executing: {}", lambda: " ".join(cmd) if isinstance(cmd, list) else cmd)
 
     # Validate command for security
     is_valid, error_msg = _validate_command_security(cmd)
@@ -45,24 +94,52 @@ def execute_command(
         return -1, "", f"Command rejected: {error_msg}"
 
     try:
-        # Handle shell commands with pipes for AWS ECR authentication
-        if isinstance(cmd, str) and "|" in cmd and "aws ecr get-login-password" in cmd:
-            # Special case for ECR authentication command - requires shell=True for pipe
-            # nosemgrep: subprocess-shell-true
-            result = subprocess.run(cmd, shell=True, check=check, text=text, capture_output=True)  # nosec: B602 inputs are validated
+        # ECR authentication pipes the password between two processes without a shell
+        ecr_match = _match_ecr_login(shlex.split(cmd)) if isinstance(cmd, str) else None
+        upstream: subprocess.Popen | None = None
+        if ecr_match:
+            upstream, process = _start_ecr_login_pipeline(ecr_match["region"], ecr_match["registry"])
         else:
             # Standard execution without shell for security
-            result = subprocess.run(cmd, shell=False, check=check, text=text, capture_output=True)  # nosec: B603 inputs are validated
+            process = subprocess.Popen(cmd, shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)  # nosec: B603 inputs are validated
+
+        # Drain all pipes concurrently so none can fill up and block its process
+        stdout_lines: deque[bytes] = deque(maxlen=max_output_lines)
+        stderr_lines: deque[bytes] = deque(maxlen=max_output_lines)
+        upstream_stderr_lines: deque[bytes] = deque(maxlen=max_output_lines)
+        readers = [
+            threading.Thread(target=_drain_stream, args=(process.stdout, stdout_lines, log_output), daemon=True),
+            threading.Thread(target=_drain_stream, args=(process.stderr, stderr_lines, False), daemon=True),
+        ]
+        if upstream is not None and upstream.stderr is not None:
+            readers.append(
+                threading.Thread(
+                    target=_drain_stream, args=(upstream.stderr, upstream_stderr_lines, False), daemon=True
+                )
+            )
+        for reader in readers:
+            reader.start()
+        returncode = process.wait()
+        if upstream is not None:
+            upstream.wait()
+        for reader in readers:
+            reader.join()
+
+        raw_stdout = b"".join(stdout_lines)
+        # Surface errors from the password half of the pipeline, which otherwise only show up as a failed login
+        raw_stderr = b"".join(upstream_stderr_lines) + b"".join(stderr_lines)
+
+        # With text=False callers get raw bytes, matching subprocess text semantics
+        stdout: Any = _decode_output(raw_stdout) if text else raw_stdout
+        stderr: Any = _decode_output(raw_stderr) if text else raw_stderr
 
-        if log_output:
-            if result.returncode == 0:
-                if result.stdout and result.stdout.strip():
-                    logger.debug(f"Command output: {result.stdout.strip()}")
-            else:
-                if result.stderr and result.stderr.strip():
-                    logger.error(f"Command error: {result.stderr.strip()}")
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd, output=stdout, stderr=stderr)
 
-        return result.returncode, result.stdout, result.stderr
+        if log_output and returncode != 0 and stderr and stderr.strip():
+            logger.error(f"Command error: {stderr.strip()}")
+
+        return returncode, stdout, stderr
     except subprocess.CalledProcessError as e:
         logger.error(f"Command failed with exit code {e.returncode}: {e.stderr}")
         return e.returncode, e.stdout or "", e.stderr or ""
@@ -71,11 +148,88 @@ def execute_command(
         return -1, "", str(e)
 
 
+def _start_ecr_login_pipeline(region: str, registry: str) -> tuple[subprocess.Popen, subprocess.Popen]:
+    """Start ``aws ecr get-login-password | docker login`` as two connected processes.
+
+    Args:
+        region: AWS region to get the ECR password for
+        registry: ECR registry host to log in to
+
+    Returns:
+        Tuple[Popen, Popen]: (password process, login process)
+    """
+    password_proc = subprocess.Popen(  # nosec: B603 inputs are validated
+        ["aws", "ecr", "get-login-password", "--region", region], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    try:
+        login_proc = subprocess.Popen(  # nosec: B603 inputs are validated
+            ["docker", "login", "--username", "AWS", "--password-stdin", registry],
+            stdin=password_proc.stdout,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except BaseException:
+        # Don't leave the password process running if docker can't be started
+        password_proc.kill()
+        password_proc.wait()
+        raise
+    # Let the password process receive SIGPIPE if docker login exits early
+    if password_proc.stdout is not None:
+        password_proc.stdout.close()
+    return password_proc, login_proc
+
+
+def _match_ecr_login(tokens: list[str]) -> re.Match[str] | None:
+    """Match argv tokens against the ECR login pipeline.
+
+    Validation and dispatch both match the shlex tokens of a string command, so a
+    command is only run as a pipeline if it was validated as one.
+
+    Args:
+        tokens: Command split into argv tokens
+
+    Returns:
+        Match with ``region`` and ``registry`` groups, or None
+    """
+    return _ECR_PATTERN.fullmatch(" ".join(tokens))
+
+
+def _drain_stream(stream: IO[bytes], lines: deque[bytes], log_lines: bool) -> None:
+    """Read a subprocess pipe to EOF, buffering lines and optionally forwarding them to the logger.
+
+    Lines are kept as bytes and only decoded for logging when a sink accepts DEBUG.
+
+    Args:
+        stream: Binary pipe to read from
+        lines: Buffer receiving each line; a bounded deque keeps only the tail
+        log_lines: Whether to log each non-empty line at debug level
+    """
+    with stream:
+        for line in stream:
+            lines.append(line)
+            if log_lines and line.strip():
+                logger.opt(lazy=True).debug("Command output: {}", lambda: _decode_output(line).rstrip())
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured subprocess output the way text-mode pipes would.
+
+    Args:
+        data: Raw output bytes
+
+    Returns:
+        str: Decoded output with universal newlines
+    """
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
 def _validate_command_security(cmd: Union[list[str], str]) -> tuple[bool, str]:
     """Validate command for security based on AgentCore CLI use cases.
 
     This function allows only specific command patterns that are legitimate
-    for AgentCore CLI operations and prevents command injection.
+    for AgentCore CLI operations and prevents command injection. Results are
+    memoized, so repeated commands (e.g. tagging and pushing in a loop) skip
+    re-validation.
 
     Args:
         cmd: Command to validate
@@ -83,70 +237,70 @@ def _validate_command_security(cmd: Union[list[str], str]) -> tuple[bool, str]:
     Returns:
         Tuple[bool, str]: (is_valid, error_message)
     """
-    # Convert command to string for validation
-    if isinstance(cmd, list):
-        cmd_str = " ".join(cmd)
-        first_arg = cmd[0] if cmd else ""
+    # Lists become tuples to be hashable; strings are kept as-is so they never collide with argv keys
+    return _validate_cached(tuple(cmd) if isinstance(cmd, list) else cmd)
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_cached(cmd: Union[tuple[str, ...], str]) -> tuple[bool, str]:
+    """Validate a hashable command, caching both accepted and rejected results.
+
+    String commands are tokenized once and validated with the same argv-based
+    checks as argument tuples.
+
+    Args:
+        cmd: Command to validate, as an argument tuple or shell string
+
+    Returns:
+        Tuple[bool, str]: (is_valid, error_message)
+    """
+    # Normalize to argv tokens
+    if isinstance(cmd, tuple):
+        tokens = list(cmd)
     else:
-        cmd_str = cmd
-        first_arg = cmd_str.split()[0] if cmd_str.strip() else ""
+        try:
+            tokens = shlex.split(cmd)
+        except ValueError as e:
+            return False, f"Command could not be parsed: {e}"
 
-    # Define allowed command patterns for AgentCore CLI
-    allowed_commands = {
-        # Docker commands
-        "docker": ["build", "tag", "push", "pull", "images", "inspect", "rmi", "buildx"],
-        # AWS CLI commands
-        "aws": ["--version", "ecr", "sts"],
-    }
+    first_arg = tokens[0] if tokens else ""
 
     # Check if command starts with allowed binary
-    if first_arg not in allowed_commands:
-        return False, f"Command must start with one of: {', '.join(allowed_commands.keys())}"
+    if first_arg not in _ALLOWED_BINARIES:
+        return False, f"Command must start with one of: {_BINARIES_ALLOWED_STR}"
+
+    # Fast path: whitelisted subcommand and no suspicious element need no further checks
+    if (
+        (len(tokens) == 1 or tokens[1] in _ALLOWED_SUBCOMMANDS[first_arg])
+        and not any(c in arg for arg in tokens for c in _DANGEROUS_CHARSET)
+        and not any(_RM_PATTERN.search(arg) for arg in tokens)
+    ):
+        return True, ""
 
     # For Docker commands, validate subcommands
-    if first_arg == "docker":
-        if isinstance(cmd, list) and len(cmd) > 1:
-            subcommand = cmd[1]
-            if subcommand not in allowed_commands["docker"]:
-                return (
-                    False,
-                    f"Docker subcommand '{subcommand}' not allowed. Allowed: {', '.join(allowed_commands['docker'])}",
-                )
-        elif isinstance(cmd, str):
-            # Extract subcommand from string
-            parts = cmd_str.split()
-            if len(parts) > 1:
-                subcommand = parts[1]
-                if subcommand not in allowed_commands["docker"]:
-                    return (
-                        False,
-                        f"Docker subcommand '{subcommand}' not allowed. Allowed: {', '.join(allowed_commands['docker'])}",
-                    )
-
-    # Special validation for AWS ECR authentication (allows pipes in this specific case)
-    if "aws ecr get-login-password" in cmd_str and "docker login" in cmd_str:
-        # Validate the ECR authentication pattern
-        ecr_pattern = re.compile(
-            r"aws ecr get-login-password --region [\w-]+ \| docker login --username AWS --password-stdin [\w.-]+\.dkr\.ecr\.[\w-]+\.amazonaws\.com"
-        )
-        if ecr_pattern.match(cmd_str.strip()):
+    if first_arg == "docker" and len(tokens) > 1 and tokens[1] not in _ALLOWED_SUBCOMMANDS["docker"]:
+        return False, f"Docker subcommand '{tokens[1]}' not allowed. Allowed: {_DOCKER_ALLOWED_STR}"
+
+    # Special validation for AWS ECR authentication (allows pipes in this specific case).
+    # Only shell strings are run as a pipeline, so argv lists never need the joined form.
+    if isinstance(cmd, str) and tokens[:3] == _ECR_AUTH_PREFIX:
+        if _match_ecr_login(tokens):
             return True, ""
         else:
             return False, "Invalid ECR authentication command pattern"
 
     # Check for dangerous characters that could indicate command injection
-    dangerous_chars = ["$", "`", "&&", ";"]
-    if any(char in cmd_str for char in dangerous_chars):
-        return False, f"Command contains potentially dangerous characters: {', '.join(dangerous_chars)}"
+    for arg in tokens:
+        match = _DANGEROUS_RE.search(arg)
+        if match:
+            return False, f"Command contains potentially dangerous characters: {match.group(0)}"
 
     # Allow pipes only for specific AWS ECR authentication
-    if "|" in cmd_str and "aws ecr get-login-password" not in cmd_str:
+    if any("|" in arg for arg in tokens):
         return False, "Pipe character not allowed except for AWS ECR authentication"
 
     # Additional validation for argument patterns
-    # Check for standalone 'rm' command (not as part of other words like '--platform')
-    rm_pattern = re.compile(r"\brm\b")
-    if rm_pattern.search(cmd_str) and not cmd_str.startswith("docker rmi"):
+    if any(_RM_PATTERN.search(arg) for arg in tokens) and tokens[:2] != ["docker", "rmi"]:
         return False, "Remove commands not allowed except 'docker rmi'"
 
     return True, ""
@@ -4,8 +4,11 @@ This module provides utilities for setting up and managing AWS observability fea
 including CloudWatch Transaction Search for cost-effective tracing.
 """
 
+import functools
 import json
+import string
 import time
+from typing import Any, Callable, NamedTuple
 
 import click
 from botocore.exceptions import ClientError
@@ -14,9 +17,88 @@ from agentcore_cli.utils.aws_utils import get_aws_account_id, get_aws_session, v
 from agentcore_cli.utils.validation import validate_region
 
 
+# Backoff delays (seconds) between checks that Transaction Search configuration has propagated
+_PROPAGATION_POLL_DELAYS = (0.5, 1.0, 2.0, 4.0)
+
+# Throttling errors worth retrying with exponential backoff
+_RETRIABLE_ERROR_CODES = frozenset(
+    {"Throttling", "ThrottlingException", "TooManyRequestsException", "RequestLimitExceeded"}
+)
+_RETRY_ATTEMPTS = 4
+_RETRY_BASE_DELAY = 0.25
+
+
+def _call_with_retry(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call an AWS API, retrying throttling errors with exponential backoff.
+
+    Args:
+        fn: boto3 client method to call
+        *args: Positional arguments for the call
+        **kwargs: Keyword arguments for the call
+
+    Returns:
+        The API response
+
+    Raises:
+        ClientError: If the error is not retriable or all attempts were throttled
+    """
+    for attempt in range(_RETRY_ATTEMPTS):
+        try:
+            return fn(*args, **kwargs)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            if error_code not in _RETRIABLE_ERROR_CODES or attempt == _RETRY_ATTEMPTS - 1:
+                raise
+            time.sleep(_RETRY_BASE_DELAY * 2**attempt)
+
+
+@functools.cache
+def _get_account_id() -> str | None:
+    """Get the AWS account ID once; it is the same whichever region a manager targets.
+
+    Returns:
+        The AWS account ID or None if credentials are invalid
+    """
+    return get_aws_account_id()
+
+
+class TransactionSearchStatus(NamedTuple):
+    """Transaction Search status for a region."""
+
+    enabled: bool
+    status_message: str | None
+    region: str
+    account_id: str | None
+
+
 class TransactionSearchManager:
     """Manages AWS CloudWatch Transaction Search configuration."""
 
+    # Serialized once; only the region and account ID vary between calls
+    _POLICY_TEMPLATE = string.Template(
+        json.dumps(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Sid": "TransactionSearchXRayAccess",
+                        "Effect": "Allow",
+                        "Principal": {"Service": "xray.amazonaws.com"},
+                        "Action": "logs:PutLogEvents",
+                        "Resource": [
+                            "arn:aws:logs:${region}:${account_id}:log-group:aws/spans:*",
+                            "arn:aws:logs:${region}:${account_id}:log-group:/aws/application-signals/data:*",
+                        ],
+                        "Condition": {
+                            "ArnLike": {"aws:SourceArn": "arn:aws:logs:${region}:${account_id}:*"},
+                            "StringEquals": {"aws:SourceAccount": "${account_id}"},
+                        },
+                    }
+                ],
+            }
+        )
+    )
+
     def __init__(self, region: str):
         """Initialize the Transaction Search manager.
 
@@ -38,7 +120,7 @@ class TransactionSearchManager:
         session = get_aws_session(region=region)
         self.xray_client = session.client("xray")
         self.logs_client = session.client("logs")
-        self.account_id = get_aws_account_id()
+        self.account_id = _get_account_id()
 
     def is_transaction_search_enabled(self) -> tuple[bool, str | None]:
         """Check if Transaction Search is enabled.
@@ -70,28 +152,12 @@ class TransactionSearchManager:
             True if policy was created successfully, False otherwise
         """
         try:
-            policy_document = {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Sid": "TransactionSearchXRayAccess",
-                        "Effect": "Allow",
-                        "Principal": {"Service": "xray.amazonaws.com"},
-                        "Action": "logs:PutLogEvents",
-                        "Resource": [
-                            f"arn:aws:logs:{self.region}:{self.account_id}:log-group:aws/spans:*",
-                            f"arn:aws:logs:{self.region}:{self.account_id}:log-group:/aws/application-signals/data:*",
-                        ],
-                        "Condition": {
-                            "ArnLike": {"aws:SourceArn": f"arn:aws:logs:{self.region}:{self.account_id}:*"},
-                            "StringEquals": {"aws:SourceAccount": self.account_id},
-                        },
-                    }
-                ],
-            }
+            policy_document = self._POLICY_TEMPLATE.substitute(region=self.region, account_id=self.account_id)
 
-            self.logs_client.put_resource_policy(
-                policyName="AgentCoreTransactionSearchPolicy", policyDocument=json.dumps(policy_document)
+            _call_with_retry(
+                self.logs_client.put_resource_policy,
+                policyName="AgentCoreTransactionSearchPolicy",
+                policyDocument=policy_document,
             )
 
             return True
@@ -107,7 +173,7 @@ class TransactionSearchManager:
             True if destination was configured successfully, False otherwise
         """
         try:
-            self.xray_client.update_trace_segment_destination(Destination="CloudWatchLogs")
+            _call_with_retry(self.xray_client.update_trace_segment_destination, Destination="CloudWatchLogs")
             return True
 
         except ClientError as e:
@@ -124,8 +190,10 @@ class TransactionSearchManager:
             True if indexing rule was configured successfully, False otherwise
         """
         try:
-            self.xray_client.update_indexing_rule(
-                Name="Default", Rule={"Probabilistic": {"DesiredSamplingPercentage": sampling_percentage}}
+            _call_with_retry(
+                self.xray_client.update_indexing_rule,
+                Name="Default",
+                Rule={"Probabilistic": {"DesiredSamplingPercentage": sampling_percentage}},
             )
             return True
 
@@ -159,12 +227,16 @@ class TransactionSearchManager:
         if not self.configure_indexing_rule(sampling_percentage):
             return False
 
-        # Step 4: Wait a moment for configuration to propagate
+        # Step 4: Poll with backoff until configuration has propagated
         click.echo("   ⏳ Waiting for configuration to propagate...")
-        time.sleep(5)
-
-        # Step 5: Verify configuration
-        is_enabled, status_msg = self.is_transaction_search_enabled()
+        is_enabled, status_msg = False, None
+        for delay in _PROPAGATION_POLL_DELAYS:
+            time.sleep(delay)
+            is_enabled, status_msg = self.is_transaction_search_enabled()
+            if is_enabled:
+                break
+
+        # Step 5: Report verification result
         if is_enabled:
             click.echo("   ✅ Transaction Search enabled successfully")
             click.echo("   📝 Note: It may take up to 10 minutes for spans to become available for search")
@@ -174,6 +246,19 @@ class TransactionSearchManager:
             return False
 
 
+@functools.lru_cache(maxsize=8)
+def _get_manager(region: str) -> TransactionSearchManager:
+    """Get a Transaction Search manager for a region, reusing previously built ones.
+
+    Args:
+        region: AWS region to operate in
+
+    Returns:
+        A cached TransactionSearchManager for the region
+    """
+    return TransactionSearchManager(region)
+
+
 def validate_and_enable_transaction_search(region: str = "us-west-2", interactive: bool = True) -> bool:
     """Validate Transaction Search status and enable if needed.
 
@@ -185,7 +270,7 @@ def validate_and_enable_transaction_search(region: str = "us-west-2", interactiv
         True if Transaction Search is enabled (or was enabled successfully), False otherwise
     """
     try:
-        manager = TransactionSearchManager(region)
+        manager = _get_manager(region)
 
         # Check current status
         is_enabled, status_msg = manager.is_transaction_search_enabled()
@@ -227,24 +312,23 @@ def validate_and_enable_transaction_search(region: str = "us-west-2", interactiv
         return False
 
 
-def get_transaction_search_status(region: str = "us-west-2") -> dict[str, str | bool | None]:
+def get_transaction_search_status(region: str = "us-west-2") -> TransactionSearchStatus:
     """Get detailed Transaction Search status information.
 
     Args:
         region: AWS region to check
 
     Returns:
-        Dictionary with status information
+        TransactionSearchStatus with status information
     """
     try:
-        manager = TransactionSearchManager(region)
+        manager = _get_manager(region)
         is_enabled, status_msg = manager.is_transaction_search_enabled()
 
-        return {
-            "enabled": is_enabled,
-            "status_message": status_msg,
-            "region": region,
-            "account_id": get_aws_account_id(),
-        }
+        return TransactionSearchStatus(
+            enabled=is_enabled, status_message=status_msg, region=region, account_id=manager.account_id
+        )
     except Exception as e:
-        return {"enabled": False, "status_message": f"Error checking status: {e}", "region": region, "account_id": None}
+        return TransactionSearchStatus(
+            enabled=False, status_message=f"Error checking status: {e}", region=region, account_id=None
+        )
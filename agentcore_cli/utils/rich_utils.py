@@ -2,98 +2,215 @@
 
 This module provides centralized Rich utilities for beautiful terminal output
 without using progress bars (which can be glitchy).
+
+Rich submodules are imported on first use and the console is created lazily,
+so commands that never render (e.g. ``--help``) don't pay Rich's import cost.
 """
 
-from rich.console import Console
-from rich.table import Table
-from rich.json import JSON
-from rich.syntax import Syntax
-from rich.text import Text
-from rich.tree import Tree
-from rich.columns import Columns
-from rich.markdown import Markdown
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from collections.abc import Iterator, Sequence
+import functools
 import json
 import re
+import sys
+
+# orjson is an optional, faster drop-in for serializing responses
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+    from rich.markdown import Markdown
+    from rich.syntax import Syntax
+    from rich.table import Table
+    from rich.text import Text
+    from rich.tree import Tree
+
+
+_console: "Console | None" = None
+
+
+class _DeferredFlushStdout:
+    """Writer for piped output that leaves flushing to Python's own stdout buffering.
+
+    Rich flushes its file after every print, costing a write syscall per call when
+    output is redirected. Writes still go to the current ``sys.stdout``, so ordering
+    with ``click.echo`` output is preserved.
+    """
+
+    def write(self, text: str) -> int:
+        return sys.stdout.write(text)
+
+    def flush(self) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(sys.stdout, name)
+
+
+def get_console() -> "Console":
+    """Get the global Rich console instance, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        # Only defer flushing when piped; interactive output stays unbuffered
+        _console = Console() if sys.stdout.isatty() else Console(file=_DeferredFlushStdout())  # type: ignore[arg-type]
+    return _console
+
+
+class _LazyConsole:
+    """Proxy that forwards attribute access to the lazily created global console."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_console(), name)
 
 
 # Global console instance for consistent output
-console = Console()
+console: "Console" = _LazyConsole()  # type: ignore[assignment]
+
+
+def _markup(text: str, style: str = "") -> "Text":
+    """Render a markup string into Text the same way console.print would."""
+    rendered = get_console().render_str(text)
+    # Applied as the base style, like console.print(..., style=...)
+    rendered.style = style
+    return rendered
+
+
+def _print_lines(lines: Sequence["RenderableType"]) -> None:
+    """Print several lines with a single console.print call."""
+    from rich.console import Group
+
+    get_console().print(Group(*lines))
+
+
+# Common markdown patterns, fixed at import time
+_MARKDOWN_PATTERNS = (
+    r"#{1,6}\s+",  # Headers
+    r"\*\*.+?\*\*",  # Bold
+    r"\*.+?\*",  # Italic
+    r"`.+?`",  # Inline code
+    r"```[\s\S]*?```",  # Code blocks
+    r"\[.+?\]\(.+?\)",  # Links
+    r"^\s*[-*+]\s+",  # Lists
+    r"^\s*\d+\.\s+",  # Numbered lists
+    r"^\s*>\s+",  # Blockquotes
+)
+
+# All patterns combined into one alternation so detection is a single scan
+_MARKDOWN_RE = re.compile("(?m)(?:" + "|".join(_MARKDOWN_PATTERNS) + ")")
 
 
 def print_success(message: str, details: str | None = None) -> None:
     """Print a success message with consistent styling."""
-    text = Text("✅ ", style="green") + Text(message, style="green bold")
-    console.print(text)
+    from rich.text import Text
+
+    lines: list[RenderableType] = [Text("✅ ", style="green") + Text(message, style="green bold")]
     if details:
-        console.print(f"   {details}", style="dim")
+        lines.append(_markup(f"   {details}", style="dim"))
+    _print_lines(lines)
 
 
 def print_error(message: str, details: str | None = None) -> None:
     """Print an error message with consistent styling."""
-    text = Text("❌ ", style="red") + Text(message, style="red bold")
-    console.print(text)
+    from rich.text import Text
+
+    lines: list[RenderableType] = [Text("❌ ", style="red") + Text(message, style="red bold")]
     if details:
-        console.print(f"   {details}", style="dim red")
+        lines.append(_markup(f"   {details}", style="dim red"))
+    _print_lines(lines)
 
 
 def print_warning(message: str, details: str | None = None) -> None:
     """Print a warning message with consistent styling."""
-    text = Text("⚠️  ", style="yellow") + Text(message, style="yellow bold")
-    console.print(text)
+    from rich.text import Text
+
+    lines: list[RenderableType] = [Text("⚠️  ", style="yellow") + Text(message, style="yellow bold")]
     if details:
-        console.print(f"   {details}", style="dim yellow")
+        lines.append(_markup(f"   {details}", style="dim yellow"))
+    _print_lines(lines)
 
 
 def print_info(message: str, details: str | None = None) -> None:
     """Print an info message with consistent styling."""
-    text = Text("💡 ", style="blue") + Text(message, style="blue bold")
-    console.print(text)
+    from rich.text import Text
+
+    lines: list[RenderableType] = [Text("💡 ", style="blue") + Text(message, style="blue bold")]
     if details:
-        console.print(f"   {details}", style="dim")
+        lines.append(_markup(f"   {details}", style="dim"))
+    _print_lines(lines)
 
 
 def print_step(step_number: int, message: str, details: str | None = None) -> None:
     """Print a step message with consistent styling."""
-    text = Text(f"🔄 Step {step_number}: ", style="cyan") + Text(message, style="cyan bold")
-    console.print(text)
+    from rich.text import Text
+
+    lines: list[RenderableType] = [Text(f"🔄 Step {step_number}: ", style="cyan") + Text(message, style="cyan bold")]
     if details:
-        console.print(f"   {details}", style="dim")
+        lines.append(_markup(f"   {details}", style="dim"))
+    _print_lines(lines)
+
+
+def _section_header_lines(title: str, emoji: str = "📋") -> list["RenderableType"]:
+    """Build the lines of a section header."""
+    from rich.text import Text
+
+    return [Text(), Text(f"{emoji} ", style="bright_blue") + Text(title, style="bright_blue bold")]
 
 
 def print_section_header(title: str, emoji: str = "📋") -> None:
     """Print a section header with consistent styling."""
-    text = Text(f"{emoji} ", style="bright_blue") + Text(title, style="bright_blue bold")
-    console.print()
-    console.print(text)
+    _print_lines(_section_header_lines(title, emoji))
+
+
+# Field names whose string values are checked for markdown
+_MARKDOWN_FIELDS = frozenset({"content", "message", "text", "response", "output", "body", "description"})
+
+
+# Texts this long are scanned directly rather than hashed into the detection cache
+_MARKDOWN_CACHE_MAX_CHARS = 64 * 1024
 
 
 def is_markdown_content(text: str) -> bool:
     """Detect if text contains markdown formatting."""
+    if len(text) >= _MARKDOWN_CACHE_MAX_CHARS:
+        return _MARKDOWN_RE.search(text) is not None
+    return _is_markdown_cached(text)
 
-    # Common markdown patterns
-    markdown_patterns = [
-        r"#{1,6}\s+",  # Headers
-        r"\*\*.*?\*\*",  # Bold
-        r"\*.*?\*",  # Italic
-        r"`.*?`",  # Inline code
-        r"```.*?```",  # Code blocks
-        r"\[.*?\]\(.*?\)",  # Links
-        r"^\s*[-*+]\s+",  # Lists
-        r"^\s*\d+\.\s+",  # Numbered lists
-        r"^\s*>\s+",  # Blockquotes
-    ]
 
-    return any(re.search(pattern, text, re.MULTILINE | re.DOTALL) for pattern in markdown_patterns)
+@functools.lru_cache(maxsize=512)
+def _is_markdown_cached(text: str) -> bool:
+    """Memoized markdown detection, so the same response text is only scanned once."""
+    return _MARKDOWN_RE.search(text) is not None
+
+
+# Markdown this long is parsed on every render rather than kept in the parse cache
+_MARKDOWN_PARSE_CACHE_MAX_CHARS = 32 * 1024
 
 
 def print_markdown(content: str, title: str | None = None) -> None:
     """Print markdown content with Rich rendering."""
     if title:
-        console.print(f"\n[bold]{title}[/bold]")
+        get_console().print(f"\n[bold]{title}[/bold]")
 
-    markdown = Markdown(content)
-    console.print(markdown)
+    if len(content) > _MARKDOWN_PARSE_CACHE_MAX_CHARS:
+        from rich.markdown import Markdown
+
+        markdown = Markdown(content)
+    else:
+        markdown = _parse_markdown(content)
+    get_console().print(markdown)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_markdown(content: str) -> "Markdown":
+    """Build a Markdown renderable once per content; it parses on creation and can be rendered repeatedly."""
+    from rich.markdown import Markdown
+
+    return Markdown(content)
 
 
 def print_smart_content(content: str, title: str | None = None) -> None:
@@ -102,46 +219,147 @@ def print_smart_content(content: str, title: str | None = None) -> None:
         print_markdown(content, title)
     else:
         if title:
-            console.print(f"\n[bold]{title}[/bold]")
-        console.print(content)
+            get_console().print(f"\n[bold]{title}[/bold]")
+        get_console().print(content)
 
 
-def _find_markdown_fields(data: dict, path: str = "") -> dict[str, tuple[str, str]]:
-    """Recursively find markdown content in nested dictionaries.
+def _find_markdown_fields(data: dict, placeholder: str | None = None) -> tuple[dict, list[tuple[str, str]]]:
+    """Find markdown content in nested dictionaries.
 
-    Returns a dict of {field_path: (content, display_name)}
+    Walks the dictionaries once with an explicit stack of item iterators, in the
+    same depth-first key order as recursion. With a placeholder, a display copy
+    is built during the same walk: the dictionaries leading to each markdown
+    field are shallow-copied on first hit and the field is replaced in the copy,
+    while everything else stays shared with ``data``.
+
+    Returns a tuple of (display_data, [(content, display_name), ...]). display_data
+    is ``data`` itself when nothing was replaced.
     """
-    markdown_fields = ["content", "message", "text", "response", "output", "body", "description"]
-    found_markdown = {}
+    found_markdown: list[tuple[str, str]] = []
+    display_data = data
+    # Frames are (items, path, key in parent, source dict); copies[i] mirrors stack[i] once copied
+    stack: list[tuple[Iterator[tuple[Any, Any]], str, Any, dict]] = [(iter(data.items()), "", None, data)]
+    copies: list[dict] = []
+
+    while stack:
+        items, parent_path, _, _ = stack[-1]
+        for key, value in items:
+            current_path = f"{parent_path}.{key}" if parent_path else key
+
+            if isinstance(value, str) and key in _MARKDOWN_FIELDS and is_markdown_content(value):
+                # Found markdown content
+                display_name = current_path.replace(".", " → ").title()
+                found_markdown.append((value, display_name))
+
+                if placeholder is not None:
+                    # Copy the dictionaries down to this one that aren't copied yet, linking each into its parent
+                    for _, _, frame_key, source in stack[len(copies) :]:
+                        frame_copy = dict(source)
+                        if copies:
+                            copies[-1][frame_key] = frame_copy
+                        else:
+                            display_data = frame_copy
+                        copies.append(frame_copy)
+                    copies[-1][key] = placeholder
+            elif isinstance(value, dict):
+                # Descend into the nested dictionary, resuming this one afterwards
+                stack.append((iter(value.items()), current_path, key, value))
+                break
+        else:
+            stack.pop()
+            del copies[len(stack) :]
+
+    return display_data, found_markdown
 
-    for key, value in data.items():
-        current_path = f"{path}.{key}" if path else key
 
-        if isinstance(value, str) and key in markdown_fields and is_markdown_content(value):
-            # Found markdown content
-            display_name = current_path.replace(".", " → ").title()
-            found_markdown[current_path] = (value, display_name)
-        elif isinstance(value, dict):
-            # Recursively search nested dictionaries
-            nested_markdown = _find_markdown_fields(value, current_path)
-            found_markdown.update(nested_markdown)
+# Strings this long are parsed on every call rather than kept in the JSON parse cache
+_JSON_PARSE_CACHE_MAX_CHARS = 32 * 1024
 
-    return found_markdown
 
+def _parse_json(text: str) -> tuple[Any, bool]:
+    """Parse a string that might be JSON.
 
-def _set_nested_value(data: dict, path: str, value: str) -> None:
-    """Set a value in a nested dictionary using dot notation path."""
-    keys = path.split(".")
-    current = data
+    Returns (data, True) when the string is JSON, otherwise (text, False). Uses the
+    standard library parser, which keeps integers of any width and accepts NaN and
+    Infinity; orjson would turn wide integers into floats and reject the others.
+    """
+    if len(text) > _JSON_PARSE_CACHE_MAX_CHARS:
+        return _load_json(text)
+    return _parse_json_cached(text)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_json_cached(text: str) -> tuple[Any, bool]:
+    """Memoized ``_load_json`` for repeated responses; cached values must not be modified."""
+    return _load_json(text)
+
+
+def _load_json(text: str) -> tuple[Any, bool]:
+    """Parse text as JSON, returning (data, True), or (text, False) when it isn't JSON."""
+    try:
+        return json.loads(text), True
+    except ValueError:
+        return text, False
 
-    for key in keys[:-1]:
-        if key in current and isinstance(current[key], dict):
-            current = current[key]
+
+# Inclusive range of integers orjson serializes; anything wider raises
+_ORJSON_INT_MIN = -(2**63)
+_ORJSON_INT_MAX = 2**64 - 1
+
+
+def _orjson_matches_json(data: Any) -> bool:
+    """Check that orjson would serialize data exactly as ``json.dumps`` does.
+
+    Only plain JSON types with string keys qualify. Floats must be finite and print
+    without an exponent (orjson writes ``1e-7`` where json writes ``1e-07``), and
+    integers must fit orjson's 64-bit range.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is str or value_type is bool or value is None:
+            continue
+        if value_type is int:
+            if not _ORJSON_INT_MIN <= value <= _ORJSON_INT_MAX:
+                return False
+        elif value_type is float:
+            if value != value or value in (float("inf"), float("-inf")) or "e" in repr(value):
+                return False
+        elif value_type is dict:
+            if not all(type(key) is str for key in value):
+                return False
+            stack.extend(value.values())
+        elif value_type is list or value_type is tuple:
+            stack.extend(value)
         else:
-            return
+            return False
+    return True
+
+
+def _dump_indented(data: Any) -> str:
+    """Serialize data as JSON indented by two spaces, keeping non-ASCII characters as-is.
 
-    if keys[-1] in current:
-        current[keys[-1]] = value
+    orjson is used only when its output is identical to ``json.dumps``, so rendering
+    does not depend on whether the optional extra is installed.
+    """
+    if orjson and _orjson_matches_json(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            # e.g. strings holding lone surrogates, which json still writes out
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _json_text(data: Any) -> "Text":
+    """Build the highlighted text rich's ``JSON.from_data`` renders, serializing through ``_dump_indented``."""
+    from rich.highlighter import JSONHighlighter
+
+    text = JSONHighlighter()(_dump_indented(data))
+    text.no_wrap = True
+    text.overflow = None
+    return text
 
 
 def print_json_with_markdown(
@@ -149,40 +367,35 @@ def print_json_with_markdown(
 ) -> None:
     """Print JSON data with automatic markdown rendering for text fields."""
     if title:
-        console.print(f"\n[bold]{title}[/bold]")
+        get_console().print(f"\n[bold]{title}[/bold]")
 
-    try:
-        # Handle string that might be JSON
-        if isinstance(data, str):
-            data = json.loads(data)
+    # Handle string that might be JSON
+    data, is_json = _parse_json(data) if isinstance(data, str) else (data, True)
+    if not is_json:
+        # If not valid JSON, try to render as markdown or plain text
+        print_smart_content(str(data), title)
+        return
 
+    try:
         if render_markdown_fields and isinstance(data, dict):
-            # Find all markdown content recursively
-            markdown_content = _find_markdown_fields(data)
+            # Find all markdown content recursively, blanking it in a display copy
+            display_data, markdown_content = _find_markdown_fields(data, "[Rendered as markdown below]")
 
             if markdown_content:
                 # Print the JSON structure first (without markdown fields)
-                display_data = json.loads(json.dumps(data))  # Deep copy
-
-                for path, (content, display_name) in markdown_content.items():
-                    _set_nested_value(display_data, path, "[Rendered as markdown below]")
-
-                # Show JSON structure
-                json_obj = JSON.from_data(display_data)
-                console.print(json_obj)
+                get_console().print(_json_text(display_data))
 
                 # Render markdown content separately
-                for path, (content, display_name) in markdown_content.items():
-                    console.print()
+                for content, display_name in markdown_content:
+                    get_console().print()
                     print_markdown(content, title=f"{display_name} (Markdown)")
 
                 return
 
         # Default JSON rendering
-        json_obj = JSON.from_data(data)
-        console.print(json_obj)
-    except (json.JSONDecodeError, TypeError):
-        # If not valid JSON, try to render as markdown or plain text
+        get_console().print(_json_text(data))
+    except TypeError:
+        # If the data can't be rendered as JSON, try to render as markdown or plain text
         print_smart_content(str(data), title)
 
 
@@ -199,45 +412,38 @@ def print_agent_response(response: dict | str, title: str = "Agent Response") ->
 def print_agent_response_raw(response: dict | str, title: str = "Agent Response") -> None:
     """Print agent response with markdown extracted but shown as raw text for clipboard usability."""
     if title:
-        console.print(f"\n[bold]{title}[/bold]")
+        get_console().print(f"\n[bold]{title}[/bold]")
 
-    try:
-        # Handle string that might be JSON
-        if isinstance(response, str):
-            data = json.loads(response)
-        else:
-            data = response
+    # Handle string that might be JSON
+    data, is_json = _parse_json(response) if isinstance(response, str) else (response, True)
+    if not is_json:
+        # If not valid JSON, print as plain text
+        get_console().print(response)
+        return
 
+    try:
         if isinstance(data, dict):
-            # Find all markdown content recursively
-            markdown_content = _find_markdown_fields(data)
+            # Find all markdown content recursively, blanking it in a display copy
+            display_data, markdown_content = _find_markdown_fields(data, "[Raw markdown shown below]")
 
             if markdown_content:
                 # Print the JSON structure first (without markdown fields)
-                display_data = json.loads(json.dumps(data))  # Deep copy
-
-                for path, (content, display_name) in markdown_content.items():
-                    _set_nested_value(display_data, path, "[Raw markdown shown below]")
-
-                # Show JSON structure
-                json_obj = JSON.from_data(display_data)
-                console.print(json_obj)
+                get_console().print(_json_text(display_data))
 
                 # Show raw markdown content (not rendered)
-                for path, (content, display_name) in markdown_content.items():
-                    console.print()
-                    console.print(f"[bold]{display_name} (Raw Markdown):[/bold]")
-                    console.print("─" * (len(display_name) + 15))
-                    console.print(content)
+                for content, display_name in markdown_content:
+                    get_console().print()
+                    get_console().print(f"[bold]{display_name} (Raw Markdown):[/bold]")
+                    get_console().print("─" * (len(display_name) + 15))
+                    get_console().print(content)
 
                 return
 
         # Default JSON rendering if no markdown found
-        json_obj = JSON.from_data(data)
-        console.print(json_obj)
-    except (json.JSONDecodeError, TypeError):
-        # If not valid JSON, print as plain text
-        console.print(str(response))
+        get_console().print(_json_text(data))
+    except TypeError:
+        # If the data can't be rendered as JSON, print as plain text
+        get_console().print(str(response))
 
 
 def extract_response_content(response: dict | str, prefer_markdown: bool = True) -> str:
@@ -250,48 +456,51 @@ def extract_response_content(response: dict | str, prefer_markdown: bool = True)
     Returns:
         The extracted content as a plain string
     """
-    try:
-        # Handle string that might be JSON
-        if isinstance(response, str):
-            data = json.loads(response)
-        else:
-            data = response
+    # Handle string that might be JSON
+    data, is_json = _parse_json(response) if isinstance(response, str) else (response, True)
+    if not is_json:
+        # If not valid JSON, return as-is
+        return str(response)
 
+    try:
         if prefer_markdown and isinstance(data, dict):
             # Find all markdown content recursively
-            markdown_content = _find_markdown_fields(data)
+            _, markdown_content = _find_markdown_fields(data)
 
             if markdown_content:
                 # Return all markdown content concatenated
                 contents = []
-                for path, (content, display_name) in markdown_content.items():
+                for content, display_name in markdown_content:
                     contents.append(content)
                 return "\n\n".join(contents)
 
         # If no markdown found or prefer_markdown is False, return the JSON
         if isinstance(data, (dict, list)):
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return _dump_indented(data)
         else:
             return str(data)
 
-    except (json.JSONDecodeError, TypeError):
-        # If not valid JSON, return as-is
+    except TypeError:
+        # If the data can't be serialized, return as-is
         return str(response)
 
 
 def create_table(
     title: str, columns: list[str], rows: list[list[str]], show_header: bool = True, show_lines: bool = False
-) -> Table:
+) -> "Table":
     """Create a Rich table with consistent styling."""
+    from rich.table import Table
+
     table = Table(title=title, show_header=show_header, show_lines=show_lines)
 
     # Add columns
     for column in columns:
         table.add_column(column, style="cyan")
 
-    # Add rows
+    # Add rows through a bound method, saving an attribute lookup per row
+    add_row = table.add_row
     for row in rows:
-        table.add_row(*row)
+        add_row(*row)
 
     return table
 
@@ -301,47 +510,54 @@ def print_table(
 ) -> None:
     """Print a table with Rich formatting."""
     table = create_table(title, columns, rows, show_header, show_lines)
-    console.print(table)
+    get_console().print(table)
 
 
 def print_section_block(content: str, title: str | None = None, style: str = "blue") -> None:
     """Print content in a simple block format (clipboard-friendly)."""
+    lines: list[RenderableType] = []
     if title:
-        console.print(f"\n[{style} bold]{title}[/{style} bold]")
-        console.print("─" * len(title), style=style)
-    console.print(f"[{style}]{content}[/{style}]")
+        lines.append(_markup(f"\n[{style} bold]{title}[/{style} bold]"))
+        lines.append(_markup("─" * len(title), style=style))
+    lines.append(_markup(f"[{style}]{content}[/{style}]"))
+    _print_lines(lines)
+
+
+# Key names whose values are masked, matched case-insensitively anywhere in the key
+_SENSITIVE_KEY_RE = re.compile(r"key|secret|token|password", re.IGNORECASE)
 
 
 def print_key_value_pairs(pairs: dict[str, Any], title: str | None = None) -> None:
     """Print key-value pairs with consistent formatting."""
-    if title:
-        print_section_header(title)
+    lines = _section_header_lines(title) if title else []
 
     for key, value in pairs.items():
         # Mask sensitive values
-        display_value = (
-            "***"
-            if any(sensitive in key.lower() for sensitive in ["key", "secret", "token", "password"])
-            else str(value)
-        )
-        console.print(f"   {key}: [bold]{display_value}[/bold]")
+        display_value = "***" if _SENSITIVE_KEY_RE.search(key) else str(value)
+        lines.append(_markup(f"   {key}: [bold]{display_value}[/bold]"))
+    _print_lines(lines)
 
 
-def create_status_tree(title: str, items: dict[str, Any]) -> Tree:
+def create_status_tree(title: str, items: dict[str, Any]) -> "Tree":
     """Create a tree view for hierarchical status information."""
+    from rich.tree import Tree
+
     tree = Tree(f"[bold blue]{title}[/bold blue]")
 
+    add = tree.add
     for key, value in items.items():
         if isinstance(value, dict):
-            branch = tree.add(f"[cyan]{key}[/cyan]")
-            for sub_key, sub_value in value.items():
-                branch.add(f"{sub_key}: [bold]{sub_value}[/bold]")
+            children = [f"{sub_key}: [bold]{sub_value}[/bold]" for sub_key, sub_value in value.items()]
         elif isinstance(value, list):
-            branch = tree.add(f"[cyan]{key}[/cyan]")
-            for item in value:
-                branch.add(f"• {item}")
+            children = [f"• {item}" for item in value]
         else:
-            tree.add(f"[cyan]{key}[/cyan]: [bold]{value}[/bold]")
+            add(f"[cyan]{key}[/cyan]: [bold]{value}[/bold]")
+            continue
+
+        # Labels are formatted up front and added through the branch's bound method
+        add_child = add(f"[cyan]{key}[/cyan]").add
+        for child in children:
+            add_child(child)
 
     return tree
 
@@ -349,22 +565,24 @@ def create_status_tree(title: str, items: dict[str, Any]) -> Tree:
 def print_status_tree(title: str, items: dict[str, Any]) -> None:
     """Print a tree view for hierarchical status information."""
     tree = create_status_tree(title, items)
-    console.print(tree)
+    get_console().print(tree)
 
 
 def print_next_steps(steps: list[str]) -> None:
     """Print next steps with consistent formatting."""
-    print_section_header("Next Steps", "🚀")
+    lines = _section_header_lines("Next Steps", "🚀")
     for i, step in enumerate(steps, 1):
-        console.print(f"   {i}. {step}")
+        lines.append(_markup(f"   {i}. {step}"))
+    _print_lines(lines)
 
 
 def print_command_examples(examples: list[tuple[str, str]]) -> None:
     """Print command examples with syntax highlighting."""
-    print_section_header("Examples", "💡")
+    lines = _section_header_lines("Examples", "💡")
     for command, description in examples:
-        console.print(f"   • {description}:")
-        console.print(f"     [bold cyan]{command}[/bold cyan]")
+        lines.append(_markup(f"   • {description}:"))
+        lines.append(_markup(f"     [bold cyan]{command}[/bold cyan]"))
+    _print_lines(lines)
 
 
 def print_ascii_banner(subtitle: str | None = None) -> None:
@@ -372,11 +590,11 @@ def print_ascii_banner(subtitle: str | None = None) -> None:
     try:
         from agentcore_cli.static.banner import banner_ascii
 
-        console.print()
-        console.print(f"[bright_blue]{banner_ascii}[/bright_blue]")
+        lines = [_markup(""), _markup(f"[bright_blue]{banner_ascii}[/bright_blue]")]
         if subtitle:
-            console.print(f"[bright_blue bold]   {subtitle}[/bright_blue bold]")
-        console.print()
+            lines.append(_markup(f"[bright_blue bold]   {subtitle}[/bright_blue bold]"))
+        lines.append(_markup(""))
+        _print_lines(lines)
     except ImportError:
         # Fallback if ASCII art can't be loaded
         print_banner("AgentCore CLI", subtitle, emoji="🚀")
@@ -384,95 +602,111 @@ def print_ascii_banner(subtitle: str | None = None) -> None:
 
 def print_banner(title: str, subtitle: str | None = None, emoji: str = "🚀", use_ascii: bool = False) -> None:
     """Print an attractive banner for major sections (clipboard-friendly)."""
-    console.print()
+    lines = [_markup("")]
 
     if use_ascii:
         try:
             from agentcore_cli.static.banner import banner_ascii
 
-            console.print(f"[bright_blue]{banner_ascii}[/bright_blue]")
+            lines.append(_markup(f"[bright_blue]{banner_ascii}[/bright_blue]"))
             if subtitle:
-                console.print(f"[bright_blue bold]   {subtitle}[/bright_blue bold]")
+                lines.append(_markup(f"[bright_blue bold]   {subtitle}[/bright_blue bold]"))
         except ImportError:
             # Fallback to regular banner if ASCII art can't be loaded
-            banner_text = f"[bright_blue bold]{emoji} {title}[/bright_blue bold]"
-            console.print(banner_text)
+            lines.append(_markup(f"[bright_blue bold]{emoji} {title}[/bright_blue bold]"))
             if subtitle:
-                console.print(f"[bright_blue]   {subtitle}[/bright_blue]")
+                lines.append(_markup(f"[bright_blue]   {subtitle}[/bright_blue]"))
     else:
-        banner_text = f"[bright_blue bold]{emoji} {title}[/bright_blue bold]"
-        console.print(banner_text)
+        lines.append(_markup(f"[bright_blue bold]{emoji} {title}[/bright_blue bold]"))
         if subtitle:
-            console.print(f"[bright_blue]   {subtitle}[/bright_blue]")
-        console.print("═" * (len(title) + 3), style="bright_blue")
+            lines.append(_markup(f"[bright_blue]   {subtitle}[/bright_blue]"))
+        lines.append(_markup("═" * (len(title) + 3), style="bright_blue"))
 
-    console.print()
+    lines.append(_markup(""))
+    _print_lines(lines)
 
 
 def print_summary_box(title: str, items: dict[str, str], style: str = "green") -> None:
     """Print a summary with key information (clipboard-friendly)."""
-    console.print()
-    console.print(f"[{style} bold]📋 {title}[/{style} bold]")
-    console.print("─" * (len(title) + 3), style=style)
+    lines = [
+        _markup(""),
+        _markup(f"[{style} bold]📋 {title}[/{style} bold]"),
+        _markup("─" * (len(title) + 3), style=style),
+    ]
 
     for key, value in items.items():
-        console.print(f"[bold]{key}:[/bold] {value}")
-    console.print()
+        lines.append(_markup(f"[bold]{key}:[/bold] {value}"))
+    lines.append(_markup(""))
+    _print_lines(lines)
 
 
-def format_file_syntax(file_path: str, content: str, language: str = "json") -> Syntax:
+def format_file_syntax(file_path: str, content: str, language: str = "json") -> "Syntax":
     """Create syntax-highlighted content for files."""
+    from rich.syntax import Syntax
+
     return Syntax(content, language, theme="monokai", line_numbers=True)
 
 
 def print_file_content(file_path: str, content: str, language: str = "json") -> None:
     """Print file content with syntax highlighting."""
     syntax = format_file_syntax(file_path, content, language)
-    console.print(f"\n📄 [bold]{file_path}[/bold]")
-    console.print(syntax)
+    _print_lines([_markup(f"\n📄 [bold]{file_path}[/bold]"), syntax])
 
 
 def print_columns(items: list[str], title: str | None = None) -> None:
     """Print items in columns for compact display."""
+    from rich.columns import Columns
+
     if title:
-        console.print(f"\n[bold]{title}[/bold]")
+        get_console().print(f"\n[bold]{title}[/bold]")
 
     columns = Columns(items, equal=True, expand=True)
-    console.print(columns)
+    get_console().print(columns)
+
+
+def _copyable_value_lines(label: str, value: str, description: str | None = None) -> list["RenderableType"]:
+    """Build the lines of a copyable value."""
+    lines: list[RenderableType] = [_markup(f"[bold cyan]{label}:[/bold cyan] {value}")]
+    if description:
+        lines.append(_markup(f"   [dim]{description}[/dim]"))
+    return lines
 
 
 def print_copyable_value(label: str, value: str, description: str | None = None) -> None:
     """Print a value that users commonly need to copy (clipboard-friendly)."""
-    console.print(f"[bold cyan]{label}:[/bold cyan] {value}")
-    if description:
-        console.print(f"   [dim]{description}[/dim]")
+    _print_lines(_copyable_value_lines(label, value, description))
 
 
 def print_copyable_values(values: dict[str, str], title: str | None = None) -> None:
     """Print multiple copyable values (clipboard-friendly)."""
-    if title:
-        print_section_header(title)
+    lines = _section_header_lines(title) if title else []
 
     for label, value in values.items():
-        print_copyable_value(label, value)
-    console.print()
+        lines.extend(_copyable_value_lines(label, value))
+    lines.append(_markup(""))
+    _print_lines(lines)
+
+
+def _command_lines(command: str, description: str | None = None) -> list["RenderableType"]:
+    """Build the lines of a copyable command."""
+    lines: list[RenderableType] = [_markup(f"[dim]{description}[/dim]")] if description else []
+    lines.append(_markup(f"[bold green]$[/bold green] [cyan]{command}[/cyan]"))
+    return lines
 
 
 def print_command(command: str, description: str | None = None) -> None:
     """Print a command that users can copy and run."""
-    if description:
-        console.print(f"[dim]{description}[/dim]")
-    console.print(f"[bold green]$[/bold green] [cyan]{command}[/cyan]")
+    _print_lines(_command_lines(command, description))
 
 
 def print_commands(commands: list[tuple[str, str | None]], title: str | None = None) -> None:
     """Print multiple commands with descriptions."""
-    if title:
-        print_section_header(title)
+    lines = _section_header_lines(title) if title else []
 
     for command, description in commands:
-        print_command(command, description)
-    console.print()
+        lines.extend(_command_lines(command, description))
+    lines.append(_markup(""))
+    _print_lines(lines)
 
 
 def confirm_action(message: str, style: str = "yellow") -> bool:
@@ -487,9 +721,3 @@ def prompt_input(message: str, default: str | None = None) -> str | None:
     from rich.prompt import Prompt
 
     return Prompt.ask(f"[cyan]{message}[/cyan]", default=default)
-
-
-# Utility function to get the global console
-def get_console() -> Console:
-    """Get the global Rich console instance."""
-    return console
@@ -1,7 +1,7 @@
 """Session utilities for AgentCore CLI."""
 
-import uuid
-from datetime import datetime
+import os
+import time
 
 
 def generate_session_id(prefix: str | None = None) -> str:
@@ -14,10 +14,10 @@ def generate_session_id(prefix: str | None = None) -> str:
         str: A string of at least 33 characters as required by AgentCore.
     """
     # Prefix with timestamp for sortability
-    timestamp = int(datetime.now().timestamp())
+    timestamp = time.time_ns() // 1_000_000_000
 
-    # Use UUID4 for uniqueness (36 chars)
-    unique_id = str(uuid.uuid4())
+    # Use 128 random bits for uniqueness (32 hex chars)
+    unique_id = os.urandom(16).hex()
 
     # Add custom prefix if provided
     if prefix:
@@ -1,12 +1,24 @@
 """Validation utilities for AgentCore CLI."""
 
+import functools
 import re
 from agentcore_cli.utils.command_executor import execute_command
 
 
+# Validation patterns, compiled once at import. The validators below are pure
+# functions of their argument, so their results are memoized as well.
+_REPO_RE = re.compile(r"[a-z0-9][a-z0-9._-]{0,254}")
+_ARN_RE = re.compile(r"^arn:(?:aws|aws-cn|aws-us-gov):([^:]*):([^:]*):([^:]*):([^:]*)(?::(.*))?$")
+_REGION_RE = re.compile(r"[a-z]{2}-[a-z]+-\d+")
+_AGENT_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9_-]{2,63}")
+
+
+@functools.lru_cache(maxsize=1)
 def validate_aws_cli() -> bool:
     """Check if AWS CLI is available on the system.
 
+    The result is cached for the life of the process, so ``aws --version`` runs at most once.
+
     Returns:
         bool: True if AWS CLI is available, False otherwise.
     """
@@ -17,6 +29,7 @@ def validate_aws_cli() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=256)
 def validate_repo_name(repo_name: str) -> tuple[bool, str]:
     """Validate ECR repository name.
 
@@ -28,14 +41,18 @@ def validate_repo_name(repo_name: str) -> tuple[bool, str]:
     Returns:
         uple[bool, str]: Success status and error message if any.
     """
-    pattern: re.Pattern = re.compile(r"^[a-z0-9][a-z0-9._-]{0,254}$")
-
-    if not pattern.match(repo_name):
+    # Cheap length and first-character checks reject most bad names before the regex runs
+    if (
+        not 1 <= len(repo_name) <= 255
+        or not (repo_name[0].isdigit() or repo_name[0].islower())
+        or not _REPO_RE.fullmatch(repo_name)
+    ):
         return False, "Repository names must match: [a-z0-9][a-z0-9._-]{0,254}"
 
     return True, ""
 
 
+@functools.lru_cache(maxsize=256)
 def validate_arn(arn: str) -> tuple[bool, str]:
     """Validate AWS ARN format.
 
@@ -45,14 +62,14 @@ def validate_arn(arn: str) -> tuple[bool, str]:
     Returns:
         Tuple[bool, str]: Success status and error message if any.
     """
-    pattern: re.Pattern = re.compile(r"^arn:(?:aws|aws-cn|aws-us-gov):([^:]*):([^:]*):([^:]*):([^:]*)(?::(.*))?$")
-
-    if not pattern.match(arn):
+    # An ARN needs the "arn:" prefix and at least five separators before the regex is worth running
+    if not arn.startswith("arn:") or arn.count(":") < 5 or not _ARN_RE.match(arn):
         return False, "Invalid ARN format. Expected: arn:partition:service:region:account-id:resource"
 
     return True, ""
 
 
+@functools.lru_cache(maxsize=256)
 def validate_region(region: str) -> tuple[bool, str]:
     """Validate AWS region format.
 
@@ -62,14 +79,14 @@ def validate_region(region: str) -> tuple[bool, str]:
     Returns:
         Tuple[bool, str]: Success status and error message if any.
     """
-    pattern: re.Pattern = re.compile(r"^[a-z]{2}-[a-z]+-\d+$")
-
-    if not pattern.match(region):
+    # Shortest valid form is "xx-y-1", with the separator always at index 2
+    if len(region) < 6 or region[2] != "-" or not _REGION_RE.fullmatch(region):
         return False, "Invalid region format. Expected: e.g., us-east-1, eu-west-2"
 
     return True, ""
 
 
+@functools.lru_cache(maxsize=256)
 def validate_agent_name(name: str) -> tuple[bool, str]:
     """Validate agent name.
 
@@ -82,9 +99,7 @@ def validate_agent_name(name: str) -> tuple[bool, str]:
     Returns:
         Tuple[bool, str]: Success status and error message if any.
     """
-    pattern: re.Pattern = re.compile(r"^[a-zA-Z][a-zA-Z0-9_-]{2,63}$")
-
-    if not pattern.match(name):
+    if not _AGENT_RE.fullmatch(name):
         return False, (
             "Agent names must be 3-64 characters, start with a letter, "
             "and contain only letters, numbers, hyphens, and underscores."
@@ -1,36 +1,113 @@
 """Pytest configuration and common fixtures for AgentCore Platform CLI tests."""
 
+import functools
 import os
 import pytest
-from boto3.session import Session
-from moto import mock_aws
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 
-@pytest.fixture(scope="function")
+# boto3, moto and the services are imported inside the fixtures that need them, so collection stays cheap
+if TYPE_CHECKING:
+    from boto3.session import Session
+
+
+@pytest.fixture(scope="session")
 def aws_credentials():
-    """Mocked AWS Credentials for moto."""
+    """Mocked AWS Credentials for moto, set once for the whole test session."""
     os.environ["AWS_ACCESS_KEY_ID"] = "testing"
     os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"  # pragma: allowlist secret
     os.environ["AWS_SECURITY_TOKEN"] = "testing"
     os.environ["AWS_SESSION_TOKEN"] = "testing"
     os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
 
+    from moto.core.config import default_user_config
+
+    # Every AWS call in the suite is mocked, so skip moto's reset of the default boto3 session on each mock start
+    default_user_config["core"]["reset_boto3_session"] = False
+
+
+@functools.cache
+def _cached_session(region_name: str | None = None) -> "Session":
+    """Build one boto3 Session per region; under moto a session carries no per-test state."""
+    from boto3.session import Session
+
+    return Session(region_name=region_name)
+
 
 @pytest.fixture
+def cached_boto3_session(monkeypatch, aws_credentials):
+    """Make services that create their own Session reuse the cached one for their region."""
+    from agentcore_cli.services import agentcore, cognito, ecr
+
+    for module in (agentcore, cognito, ecr):
+        monkeypatch.setattr(module, "Session", _cached_session)
+
+
+@pytest.fixture(scope="session")
 def aws_session(aws_credentials):
-    """Create a boto3 session with mocked credentials."""
-    with mock_aws():
-        return Session(region_name="us-east-1")
+    """Create a boto3 session with mocked credentials.
+
+    Building a Session reads the AWS config files, so one is shared by all tests;
+    its clients are intercepted by whichever mock_aws context is active.
+    """
+    return _cached_session("us-east-1")
 
 
 @pytest.fixture
 def mock_aws_services(aws_credentials):
-    """Mock all AWS services used in the application."""
-    with mock_aws():
-        yield
+    """Mock all AWS services used in the application.
 
+    moto discards all mocked resources when the context exits, so each test starts clean.
+    """
+    from moto import mock_aws
 
-@pytest.fixture
+    with mock_aws() as mock:
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def mock_aws_module(aws_credentials):
+    """Mock all AWS services once per module, for tests that only read mocked state."""
+    from moto import mock_aws
+
+    with mock_aws() as mock:
+        yield mock
+
+
+def _client_mock(client):
+    """Wrap a boto3 client so unconfigured calls still reach it and its modeled exceptions stay real."""
+    return MagicMock(wraps=client, exceptions=client.exceptions)
+
+
+@pytest.fixture(scope="module")
+def cognito_service(mock_aws_module, test_region, aws_session):
+    """CognitoService shared by a module, so its boto3 clients are built once.
+
+    The Cognito clients are wrapped in MagicMocks; tests set responses on them directly.
+    """
+    from agentcore_cli.services.cognito import CognitoService
+
+    service = CognitoService(test_region, aws_session)
+    service.cognito_idp_client = _client_mock(service.cognito_idp_client)
+    service.cognito_identity_client = _client_mock(service.cognito_identity_client)
+    return service
+
+
+@pytest.fixture(scope="module")
+def ecr_service(mock_aws_module, test_region, aws_session):
+    """ECRService shared by a module, so its boto3 clients are built once.
+
+    The ECR client is wrapped in a MagicMock; tests set responses on it directly.
+    """
+    from agentcore_cli.services.ecr import ECRService
+
+    service = ECRService(test_region, aws_session)
+    service.ecr_client = _client_mock(service.ecr_client)
+    return service
+
+
+@pytest.fixture(scope="session")
 def test_region():
     """Test AWS region."""
     return "us-east-1"
@@ -1,128 +1,125 @@
 """Unit tests for CLI commands."""
 
+import agentcore_cli.cli as cli_module
+import click
+import pkgutil
 import pytest
-from agentcore_cli.cli import cli
+from agentcore_cli.cli import cli, print_banner
+from agentcore_cli.static.banner import banner_ascii
+from agentcore_cli.utils.rich_utils import console
 from click.testing import CliRunner
 from unittest.mock import patch
 
 
-class TestCLI:
-    """Test cases for CLI commands."""
+@pytest.fixture(scope="module", autouse=True)
+def _warm_rich():
+    """Render the banner once so Rich's console and terminal probing are set up a single time."""
+    print_banner()
 
-    def test_cli_help(self):
-        """Test CLI help command."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-        assert "AgentCore Platform CLI" in result.output
 
-    def test_cli_version(self):
-        """Test CLI version command."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--version"])
-        assert result.exit_code == 0
-        assert "Version" in result.output or "Development Version" in result.output
+@pytest.fixture(scope="module")
+def runner():
+    """One CliRunner shared by the module; each invoke isolates its own I/O."""
+    return CliRunner()
 
-    def test_cli_verbose_flag(self):
-        """Test CLI verbose flag."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--verbose", "--help"])
-        assert result.exit_code == 0
 
-    def test_cli_quiet_flag(self):
-        """Test CLI quiet flag."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--quiet", "--help"])
-        assert result.exit_code == 0
+@pytest.fixture(scope="module")
+def help_result(runner):
+    """Invoke ``cli --help`` once and share the result across the module."""
+    return runner.invoke(cli, ["--help"])
 
-    def test_cli_config_option(self):
-        """Test CLI config option."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--config", "/path/to/config.json", "--help"])
-        assert result.exit_code == 0
 
-    @patch("agentcore_cli.commands.setup.setup_cli")
-    def test_setup_command(self, mock_setup):
-        """Test setup command registration."""
-        runner = CliRunner()
-        # The setup command should be registered
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-        # Note: We can't easily test the actual setup command without more complex mocking
+@pytest.fixture(scope="module")
+def help_text():
+    """Render the top-level help directly, without CliRunner's output capture."""
+    ctx = click.Context(cli, info_name="cli", **cli.context_settings)
+    return cli.get_help(ctx)
 
-    @patch("agentcore_cli.commands.unified_agent.unified_agent_cli")
-    def test_agent_command(self, mock_agent):
-        """Test agent command registration."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-        # The agent command should be registered
 
-    @patch("agentcore_cli.commands.config.config_cli")
-    def test_config_command(self, mock_config):
-        """Test config command registration."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-        # The config command should be registered
+class TestCLI:
+    """Test cases for CLI commands."""
 
-    @patch("agentcore_cli.commands.environment.env_group")
-    def test_environment_command(self, mock_env):
-        """Test environment command registration."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-        # The environment command should be registered
+    def test_cli_help(self, help_result):
+        """Test CLI help command."""
+        assert help_result.exit_code == 0
 
-    @patch("agentcore_cli.commands.container.container_group")
-    def test_container_command(self, mock_container):
-        """Test container command registration."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-        # The container command should be registered
+    @pytest.mark.parametrize(
+        "needle",
+        ["AgentCore Platform CLI", "AWS Bedrock", "ARCHITECTURE HIGHLIGHTS", "QUICK START", "COMMAND GROUPS", "--help"],
+    )
+    def test_help_contains(self, help_text, needle):
+        """Test CLI help text content."""
+        assert needle in help_text
 
-    @patch("agentcore_cli.commands.resources.resources_group")
-    def test_resources_command(self, mock_resources):
-        """Test resources command registration."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
+    def test_cli_command_structure(self, help_text):
+        """Test that the help text mentions every command group."""
+        output = help_text.lower()
+        assert all(c in output for c in ("init", "agent", "env", "container", "config", "resources"))
+
+    def test_cli_version(self, runner):
+        """Test CLI version command."""
+        result = runner.invoke(cli, ["--version"])
         assert result.exit_code == 0
-        # The resources command should be registered
+        assert "Version" in result.output or "Development Version" in result.output
 
-    def test_deploy_shortcut_command(self):
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--verbose", "--help"],
+            ["--quiet", "--help"],
+            ["--config", "/path/to/config.json", "--help"],
+            ["--config", "/custom/path/config.json", "--help"],
+        ],
+    )
+    def test_flag_accepted(self, runner, argv):
+        """Test that global flags and options are accepted."""
+        assert runner.invoke(cli, argv).exit_code == 0
+
+    def test_cli_environment_variable_support(self, monkeypatch):
+        """Test that global options fall back to their environment variables."""
+        monkeypatch.setenv("AGENTCORE_CONFIG", "/env/path/config.json")
+        monkeypatch.setenv("AGENTCORE_VERBOSE", "1")
+        # Parse options only; the group callback and help rendering are not needed to check envvar wiring
+        ctx = cli.make_context("cli", ["deploy", "test-agent"])
+        assert ctx.params["config"] == "/env/path/config.json"
+        assert ctx.params["verbose"] is True
+
+    @pytest.mark.parametrize(
+        "target",
+        [
+            "agentcore_cli.commands.setup.setup_cli",
+            "agentcore_cli.commands.unified_agent.unified_agent_cli",
+            "agentcore_cli.commands.config.config_cli",
+            "agentcore_cli.commands.environment.env_group",
+            "agentcore_cli.commands.container.container_group",
+            "agentcore_cli.commands.resources.resources_group",
+        ],
+    )
+    def test_command_registered(self, help_result, target):
+        """Test command group registration."""
+        # Each command group should exist and the CLI should still render its help
+        assert isinstance(pkgutil.resolve_name(target), click.Command)
+        assert help_result.exit_code == 0
+
+    def test_deploy_shortcut_command(self, runner):
         """Test deploy shortcut command."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["deploy", "test-agent", "--dockerfile", "Dockerfile"])
         # This is a hidden command, so it should exist but might not be visible in help
         assert result.exit_code in [0, 1]  # Could succeed or fail depending on implementation
 
-    def test_invoke_shortcut_command(self):
+    def test_invoke_shortcut_command(self, runner):
         """Test invoke shortcut command."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["invoke", "test-agent", "--prompt", "Hello, world!"])
         # This is a hidden command, so it should exist but might not be visible in help
         assert result.exit_code in [0, 1]  # Could succeed or fail depending on implementation
 
-    def test_cli_context_settings(self):
-        """Test CLI context settings."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-        # Should have help options
-        assert "-h" in result.output or "--help" in result.output
-
-    def test_cli_max_content_width(self):
+    def test_cli_max_content_width(self, help_text):
         """Test CLI max content width setting."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
         # The output should be properly formatted within the width limit
+        assert max(len(line) for line in help_text.splitlines()) <= 120
 
     def test_print_banner_function(self):
         """Test print banner function."""
-        from agentcore_cli.cli import print_banner
-
         # This should not raise an exception
         try:
             print_banner()
@@ -130,79 +127,37 @@ class TestCLI:
             # If it fails, that's okay for testing purposes
             pass
 
-    def test_cli_with_invalid_option(self):
+    def test_cli_with_invalid_option(self, runner):
         """Test CLI with invalid option."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--invalid-option"])
         assert result.exit_code != 0  # Should fail with invalid option
 
-    def test_cli_with_missing_argument(self):
+    def test_cli_with_missing_argument(self, runner):
         """Test CLI with missing argument."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["deploy"])  # Missing required argument
         assert result.exit_code != 0  # Should fail with missing argument
 
-    @patch("agentcore_cli.cli.logger")
-    def test_cli_logging_configuration(self, mock_logger):
+    @patch.object(cli_module, "logger")
+    def test_cli_logging_configuration(self, mock_logger, runner):
         """Test CLI logging configuration."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--verbose", "--help"])
         assert result.exit_code == 0
         # The logger should be configured properly
 
-    def test_cli_environment_variable_support(self):
-        """Test CLI environment variable support."""
-        runner = CliRunner()
-        # Test that environment variables are respected
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-
-    def test_cli_command_structure(self):
-        """Test CLI command structure."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-
-        # Check for expected command groups
-        result.output.lower()
-        expected_commands = ["init", "agent", "env", "container", "config", "resources"]
-
-        for _command in expected_commands:
-            # The commands should be mentioned in the help output
-            # Note: This is a basic check - actual command availability depends on registration
-            pass
-
     @pytest.mark.parametrize("command", ["init", "agent", "env", "container", "config", "resources"])
-    def test_command_group_help(self, command):
+    def test_command_group_help(self, command, runner):
         """Test help for each command group."""
-        runner = CliRunner()
         result = runner.invoke(cli, [command, "--help"])
         # Some commands might not be fully implemented in tests, so we check for various exit codes
         assert result.exit_code in [0, 1, 2]  # 0=success, 1=error, 2=usage error
 
-    def test_cli_error_handling(self):
+    def test_cli_error_handling(self, runner):
         """Test CLI error handling."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["nonexistent-command"])
         assert result.exit_code != 0  # Should fail with non-existent command
 
-    def test_cli_help_text_content(self):
-        """Test CLI help text content."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-
-        output = result.output
-        # Check for key content in help text
-        assert "AgentCore Platform CLI" in output
-        assert "AWS Bedrock" in output
-        assert "ARCHITECTURE HIGHLIGHTS" in output
-        assert "QUICK START" in output
-        assert "COMMAND GROUPS" in output
-
-    def test_cli_version_info(self):
+    def test_cli_version_info(self, runner):
         """Test CLI version information."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--version"])
         assert result.exit_code == 0
 
@@ -213,39 +168,11 @@ class TestCLI:
 
     def test_cli_banner_ascii_art(self):
         """Test CLI ASCII banner."""
-        from agentcore_cli.static.banner import banner_ascii
-
         # Check that banner_ascii is a string
         assert isinstance(banner_ascii, str)
         assert len(banner_ascii) > 0
 
     def test_cli_console_output(self):
         """Test CLI console output."""
-        from agentcore_cli.utils.rich_utils import console
-
         # The console should be properly configured
         assert console is not None
-
-    def test_cli_logging_levels(self):
-        """Test CLI logging levels."""
-        runner = CliRunner()
-
-        # Test with verbose flag
-        result = runner.invoke(cli, ["--verbose", "--help"])
-        assert result.exit_code == 0
-
-        # Test with quiet flag
-        result = runner.invoke(cli, ["--quiet", "--help"])
-        assert result.exit_code == 0
-
-    def test_cli_config_file_handling(self):
-        """Test CLI config file handling."""
-        runner = CliRunner()
-
-        # Test with custom config path
-        result = runner.invoke(cli, ["--config", "/custom/path/config.json", "--help"])
-        assert result.exit_code == 0
-
-        # Test with default config (should work)
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
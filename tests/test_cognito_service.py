@@ -2,27 +2,80 @@
 
 import pytest
 from agentcore_cli.models.resources import CognitoConfig, CognitoIdentityPool, CognitoUserPool
-from agentcore_cli.services.cognito import CognitoService
-from moto import mock_aws
+from types import MappingProxyType
 from unittest.mock import patch
 
 
+# Canned, read-only client responses shared by the tests below
+_MOCK_USER_POOLS_RESPONSE = MappingProxyType(
+    {
+        "UserPools": [
+            {"Id": "us-east-1_pool1", "Name": "test-pool-1", "CreationDate": "2024-01-01T00:00:00Z"},
+            {"Id": "us-east-1_pool2", "Name": "test-pool-2", "CreationDate": "2024-01-02T00:00:00Z"},
+        ]
+    }
+)
+_MOCK_IDENTITY_POOLS_RESPONSE = MappingProxyType(
+    {
+        "IdentityPools": [
+            {"IdentityPoolId": "us-east-1:pool1", "IdentityPoolName": "test-identity-pool-1"},
+            {"IdentityPoolId": "us-east-1:pool2", "IdentityPoolName": "test-identity-pool-2"},
+        ]
+    }
+)
+_MOCK_USERS_RESPONSE = MappingProxyType(
+    {
+        "Users": [
+            {"Username": "user1", "Attributes": [{"Name": "email", "Value": "user1@example.com"}]},
+            {"Username": "user2", "Attributes": [{"Name": "email", "Value": "user2@example.com"}]},
+        ]
+    }
+)
+_MOCK_CFN_OUTPUTS_COGNITO = (
+    MappingProxyType({"OutputKey": "UserPoolId", "OutputValue": "us-east-1_testpool123"}),
+    MappingProxyType({"OutputKey": "IdentityPoolId", "OutputValue": "us-east-1:test-identity-pool-123"}),
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients(cognito_service):
+    """Clear the responses and calls the previous test left on the shared client mocks."""
+    cognito_service.cognito_idp_client.reset_mock(return_value=True, side_effect=True)
+    cognito_service.cognito_identity_client.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def mock_cfn_success(cognito_service):
+    """Patch a successful stack deployment; tests set the stack outputs on the yielded get_stack_outputs mock."""
+    with (
+        patch.object(
+            cognito_service.cfn_service, "create_update_stack", return_value=(True, "Stack created successfully")
+        ),
+        patch.object(cognito_service.cfn_service, "get_stack_outputs") as mock_outputs,
+    ):
+        yield mock_outputs
+
+
+@pytest.mark.usefixtures("mock_aws_module")
 class TestCognitoService:
-    """Test cases for CognitoService."""
+    """Test cases for CognitoService.
 
-    @mock_aws
-    def test_init(self, test_region, aws_session):
+    Every test runs inside the module-wide moto mock, so none needs its own mock_aws context.
+    """
+
+    def test_init(self, cognito_service, test_region, aws_session):
         """Test CognitoService initialization."""
-        service = CognitoService(test_region, aws_session)
-        assert service.region == test_region
-        assert service.session == aws_session
-        assert service.cfn_service is not None
-        assert service.cognito_idp_client is not None
-        assert service.cognito_identity_client is not None
+        assert cognito_service.region == test_region
+        assert cognito_service.session == aws_session
+        assert cognito_service.cfn_service is not None
+        assert cognito_service.cognito_idp_client is not None
+        assert cognito_service.cognito_identity_client is not None
 
-    @mock_aws
+    @pytest.mark.usefixtures("cached_boto3_session")
     def test_init_without_session(self, test_region):
         """Test CognitoService initialization without session."""
+        from agentcore_cli.services.cognito import CognitoService
+
         service = CognitoService(test_region)
         assert service.region == test_region
         assert service.session is not None
@@ -30,85 +83,66 @@ class TestCognitoService:
         assert service.cognito_idp_client is not None
         assert service.cognito_identity_client is not None
 
-    @mock_aws
-    def test_create_cognito_resources_success(self, test_region, aws_session, test_agent_name):
+    def test_create_cognito_resources_success(self, cognito_service, test_agent_name, mock_cfn_success):
         """Test successful Cognito resources creation."""
-        service = CognitoService(test_region, aws_session)
-
-        # Mock CloudFormation service
-        with patch.object(service.cfn_service, "create_update_stack") as mock_cfn:
-            mock_cfn.return_value = (True, "Stack created successfully")
-
-            with patch.object(service.cfn_service, "get_stack_outputs") as mock_outputs:
-                mock_outputs.return_value = [
-                    {"OutputKey": "UserPoolId", "OutputValue": "us-east-1_testpool123"},
-                    {
-                        "OutputKey": "UserPoolArn",
-                        "OutputValue": "arn:aws:cognito-idp:us-east-1:123456789012:userpool/us-east-1_testpool123",
-                    },
-                    {"OutputKey": "UserPoolClientId", "OutputValue": "test-client-id"},
-                    {"OutputKey": "IdentityPoolId", "OutputValue": "us-east-1:test-identity-pool-123"},
-                    {
-                        "OutputKey": "IdentityPoolArn",
-                        "OutputValue": "arn:aws:cognito-identity:us-east-1:123456789012:identitypool/us-east-1:test-identity-pool-123",
-                    },
-                ]
-
-                config = service.create_cognito_resources(
-                    agent_name=test_agent_name,
-                    environment="dev",
-                    resource_name_prefix="agentcore",
-                    allow_self_registration=False,
-                    email_verification_required=True,
-                )
-
-                assert isinstance(config, CognitoConfig)
-                assert config.user_pool is not None
-                assert config.identity_pool is not None
-                assert config.user_pool.user_pool_id == "us-east-1_testpool123"
-                assert config.identity_pool.identity_pool_id == "us-east-1:test-identity-pool-123"
-
-    @mock_aws
-    def test_create_cognito_resources_template_not_found(self, test_region, aws_session, test_agent_name):
+        # Mock CloudFormation stack outputs
+        mock_cfn_success.return_value = [
+            {"OutputKey": "UserPoolId", "OutputValue": "us-east-1_testpool123"},
+            {
+                "OutputKey": "UserPoolArn",
+                "OutputValue": "arn:aws:cognito-idp:us-east-1:123456789012:userpool/us-east-1_testpool123",
+            },
+            {"OutputKey": "UserPoolClientId", "OutputValue": "test-client-id"},
+            {"OutputKey": "IdentityPoolId", "OutputValue": "us-east-1:test-identity-pool-123"},
+            {
+                "OutputKey": "IdentityPoolArn",
+                "OutputValue": "arn:aws:cognito-identity:us-east-1:123456789012:identitypool/us-east-1:test-identity-pool-123",
+            },
+        ]
+
+        config = cognito_service.create_cognito_resources(
+            agent_name=test_agent_name,
+            environment="dev",
+            resource_name_prefix="agentcore",
+            allow_self_registration=False,
+            email_verification_required=True,
+        )
+
+        assert isinstance(config, CognitoConfig)
+        assert config.user_pool is not None
+        assert config.identity_pool is not None
+        assert config.user_pool.user_pool_id == "us-east-1_testpool123"
+        assert config.identity_pool.identity_pool_id == "us-east-1:test-identity-pool-123"
+
+    def test_create_cognito_resources_template_not_found(self, cognito_service, test_agent_name):
         """Test Cognito resources creation with missing template."""
-        service = CognitoService(test_region, aws_session)
-
         # Mock template file not found
         with patch("pathlib.Path.exists", return_value=False):
             with pytest.raises(Exception, match="Template file not found"):
-                service.create_cognito_resources(test_agent_name)
+                cognito_service.create_cognito_resources(test_agent_name)
 
-    @mock_aws
-    def test_create_cognito_resources_cfn_failure(self, test_region, aws_session, test_agent_name):
+    def test_create_cognito_resources_cfn_failure(self, cognito_service, test_agent_name):
         """Test Cognito resources creation with CloudFormation failure."""
-        service = CognitoService(test_region, aws_session)
-
         # Mock CloudFormation failure
-        with patch.object(service.cfn_service, "create_update_stack") as mock_cfn:
+        with patch.object(cognito_service.cfn_service, "create_update_stack") as mock_cfn:
             mock_cfn.return_value = (False, "CloudFormation error")
 
             with pytest.raises(Exception, match="Failed to create/update Cognito stack"):
-                service.create_cognito_resources(test_agent_name)
+                cognito_service.create_cognito_resources(test_agent_name)
 
-    @mock_aws
-    def test_delete_cognito_resources_success(self, test_region, aws_session, test_agent_name):
+    def test_delete_cognito_resources_success(self, cognito_service, test_agent_name):
         """Test successful Cognito resources deletion."""
-        service = CognitoService(test_region, aws_session)
-
         # Mock CloudFormation service
-        with patch.object(service.cfn_service, "delete_stack") as mock_delete:
+        with patch.object(cognito_service.cfn_service, "delete_stack") as mock_delete:
             mock_delete.return_value = (True, "Stack deleted successfully")
 
-            success, message = service.delete_cognito_resources(test_agent_name, environment="dev")
+            success, message = cognito_service.delete_cognito_resources(test_agent_name, environment="dev")
 
             assert success is True
             assert "deleted successfully" in message
 
-    @mock_aws
-    def test_get_user_pool_success(self, test_region, aws_session, test_user_pool_id):
+    def test_get_user_pool_success(self, cognito_service, test_region, test_user_pool_id):
         """Test successful user pool retrieval."""
-        service = CognitoService(test_region, aws_session)
-
         # Mock Cognito IDP client response
         mock_response = {
             "UserPool": {
@@ -119,34 +153,27 @@ class TestCognitoService:
             }
         }
 
-        with patch.object(service.cognito_idp_client, "describe_user_pool", return_value=mock_response):
-            success, user_pool, message = service.get_user_pool(test_user_pool_id)
+        cognito_service.cognito_idp_client.describe_user_pool.return_value = mock_response
+        success, user_pool, message = cognito_service.get_user_pool(test_user_pool_id)
 
-            assert success is True
-            assert user_pool is not None
-            assert isinstance(user_pool, CognitoUserPool)
-            assert user_pool.user_pool_id == test_user_pool_id
+        assert success is True
+        assert user_pool is not None
+        assert isinstance(user_pool, CognitoUserPool)
+        assert user_pool.user_pool_id == test_user_pool_id
 
-    @mock_aws
-    def test_get_user_pool_not_found(self, test_region, aws_session, test_user_pool_id):
+    def test_get_user_pool_not_found(self, cognito_service, test_user_pool_id):
         """Test user pool retrieval when not found."""
-        service = CognitoService(test_region, aws_session)
-
         # Mock Cognito IDP client exception
-        with patch.object(service.cognito_idp_client, "describe_user_pool") as mock_describe:
-            mock_describe.side_effect = Exception("ResourceNotFoundException")
+        cognito_service.cognito_idp_client.describe_user_pool.side_effect = Exception("ResourceNotFoundException")
 
-            success, user_pool, message = service.get_user_pool(test_user_pool_id)
+        success, user_pool, message = cognito_service.get_user_pool(test_user_pool_id)
 
-            assert success is False
-            assert user_pool is None
-            assert "resourcenotfound" in message.lower() or "not found" in message.lower()
+        assert success is False
+        assert user_pool is None
+        assert "resourcenotfound" in message.lower() or "not found" in message.lower()
 
-    @mock_aws
-    def test_get_identity_pool_success(self, test_region, aws_session, test_identity_pool_id):
+    def test_get_identity_pool_success(self, cognito_service, test_identity_pool_id):
         """Test successful identity pool retrieval."""
-        service = CognitoService(test_region, aws_session)
-
         # Mock Cognito Identity client response
         mock_response = {
             "IdentityPool": {
@@ -156,202 +183,129 @@ class TestCognitoService:
             }
         }
 
-        with patch.object(service.cognito_identity_client, "describe_identity_pool", return_value=mock_response):
-            success, identity_pool, message = service.get_identity_pool(test_identity_pool_id)
+        cognito_service.cognito_identity_client.describe_identity_pool.return_value = mock_response
+        success, identity_pool, message = cognito_service.get_identity_pool(test_identity_pool_id)
 
-            assert success is True
-            assert identity_pool is not None
-            assert isinstance(identity_pool, CognitoIdentityPool)
-            assert identity_pool.identity_pool_id == test_identity_pool_id
+        assert success is True
+        assert identity_pool is not None
+        assert isinstance(identity_pool, CognitoIdentityPool)
+        assert identity_pool.identity_pool_id == test_identity_pool_id
 
-    @mock_aws
-    def test_list_user_pools_success(self, test_region, aws_session):
+    def test_list_user_pools_success(self, cognito_service):
         """Test successful user pools listing."""
-        service = CognitoService(test_region, aws_session)
-
-        # Mock Cognito IDP client response
-        mock_response = {
-            "UserPools": [
-                {"Id": "us-east-1_pool1", "Name": "test-pool-1", "CreationDate": "2024-01-01T00:00:00Z"},
-                {"Id": "us-east-1_pool2", "Name": "test-pool-2", "CreationDate": "2024-01-02T00:00:00Z"},
-            ]
-        }
-
-        with patch.object(service.cognito_idp_client, "list_user_pools", return_value=mock_response):
-            success, user_pools, message = service.list_user_pools()
-
-            assert success is True
-            assert isinstance(user_pools, list)
-            assert len(user_pools) == 2
-            assert user_pools[0]["Id"] == "us-east-1_pool1"
-
-    @mock_aws
-    def test_list_identity_pools_success(self, test_region, aws_session):
+        # Listing goes through a paginator, so mock the pages it yields
+        cognito_service.cognito_idp_client.get_paginator.return_value.paginate.return_value = [
+            _MOCK_USER_POOLS_RESPONSE
+        ]
+        success, user_pools, message = cognito_service.list_user_pools()
+
+        assert success is True
+        assert isinstance(user_pools, list)
+        assert len(user_pools) == 2
+        assert user_pools[0]["Id"] == "us-east-1_pool1"
+
+    def test_list_identity_pools_success(self, cognito_service):
         """Test successful identity pools listing."""
-        service = CognitoService(test_region, aws_session)
-
         # Mock Cognito Identity client response
-        mock_response = {
-            "IdentityPools": [
-                {"IdentityPoolId": "us-east-1:pool1", "IdentityPoolName": "test-identity-pool-1"},
-                {"IdentityPoolId": "us-east-1:pool2", "IdentityPoolName": "test-identity-pool-2"},
-            ]
-        }
+        cognito_service.cognito_identity_client.list_identity_pools.return_value = _MOCK_IDENTITY_POOLS_RESPONSE
+        success, identity_pools, message = cognito_service.list_identity_pools()
 
-        with patch.object(service.cognito_identity_client, "list_identity_pools", return_value=mock_response):
-            success, identity_pools, message = service.list_identity_pools()
+        assert success is True
+        assert isinstance(identity_pools, list)
+        assert len(identity_pools) == 2
+        assert identity_pools[0]["IdentityPoolId"] == "us-east-1:pool1"
 
-            assert success is True
-            assert isinstance(identity_pools, list)
-            assert len(identity_pools) == 2
-            assert identity_pools[0]["IdentityPoolId"] == "us-east-1:pool1"
-
-    @mock_aws
-    def test_create_user_success(self, test_region, aws_session, test_user_pool_id):
+    def test_create_user_success(self, cognito_service, test_user_pool_id):
         """Test successful user creation."""
-        service = CognitoService(test_region, aws_session)
-
         # Mock Cognito IDP client response
-        with patch.object(service.cognito_idp_client, "admin_create_user", return_value={}):
-            success, message = service.create_user(
-                user_pool_id=test_user_pool_id,
-                username="testuser",
-                password="TestPass123!",  # pragma: allowlist secret
-                email="test@example.com",
-                temp_password=True,
-            )
-
-            assert success is True
-            assert "created successfully" in message
-
-    @mock_aws
-    def test_delete_user_success(self, test_region, aws_session, test_user_pool_id):
+        cognito_service.cognito_idp_client.admin_create_user.return_value = {}
+        success, message = cognito_service.create_user(
+            user_pool_id=test_user_pool_id,
+            username="testuser",
+            password="TestPass123!",  # pragma: allowlist secret
+            email="test@example.com",
+            temp_password=True,
+        )
+
+        assert success is True
+        assert message == cognito_service.MSG_USER_CREATED.format(username="testuser")
+
+    def test_delete_user_success(self, cognito_service, test_user_pool_id):
         """Test successful user deletion."""
-        service = CognitoService(test_region, aws_session)
-
         # Mock Cognito IDP client response
-        with patch.object(service.cognito_idp_client, "admin_delete_user", return_value={}):
-            success, message = service.delete_user(test_user_pool_id, "testuser")
+        cognito_service.cognito_idp_client.admin_delete_user.return_value = {}
+        success, message = cognito_service.delete_user(test_user_pool_id, "testuser")
 
-            assert success is True
-            assert "deleted successfully" in message
+        assert success is True
+        assert message == cognito_service.MSG_USER_DELETED.format(username="testuser")
 
-    @mock_aws
-    def test_list_users_success(self, test_region, aws_session, test_user_pool_id):
+    def test_list_users_success(self, cognito_service, test_user_pool_id):
         """Test successful users listing."""
-        service = CognitoService(test_region, aws_session)
-
-        # Mock Cognito IDP client response
-        mock_response = {
-            "Users": [
-                {"Username": "user1", "Attributes": [{"Name": "email", "Value": "user1@example.com"}]},
-                {"Username": "user2", "Attributes": [{"Name": "email", "Value": "user2@example.com"}]},
-            ]
-        }
-
-        with patch.object(service.cognito_idp_client, "list_users", return_value=mock_response):
-            success, users, message = service.list_users(test_user_pool_id)
-
-            assert success is True
-            assert isinstance(users, list)
-            assert len(users) == 2
-            assert users[0]["Username"] == "user1"
-
-    @mock_aws
-    def test_check_user_pool_exists_true(self, test_region, aws_session, test_user_pool_id):
-        """Test user pool existence check when it exists."""
-        service = CognitoService(test_region, aws_session)
-
-        # Mock Cognito IDP client response
-        with patch.object(service.cognito_idp_client, "describe_user_pool", return_value={"UserPool": {}}):
-            exists = service.check_user_pool_exists(test_user_pool_id)
-
-            assert exists is True
-
-    @mock_aws
-    def test_check_user_pool_exists_false(self, test_region, aws_session, test_user_pool_id):
-        """Test user pool existence check when it doesn't exist."""
-        service = CognitoService(test_region, aws_session)
-
-        # Mock Cognito IDP client exception
-        with patch.object(service.cognito_idp_client, "describe_user_pool") as mock_describe:
-            mock_describe.side_effect = Exception("ResourceNotFoundException")
-
-            exists = service.check_user_pool_exists(test_user_pool_id)
-
-            assert exists is False
-
-    @mock_aws
-    def test_check_identity_pool_exists_true(self, test_region, aws_session, test_identity_pool_id):
-        """Test identity pool existence check when it exists."""
-        service = CognitoService(test_region, aws_session)
-
-        # Mock Cognito Identity client response
-        with patch.object(service.cognito_identity_client, "describe_identity_pool", return_value={"IdentityPool": {}}):
-            exists = service.check_identity_pool_exists(test_identity_pool_id)
-
-            assert exists is True
-
-    @mock_aws
-    def test_check_identity_pool_exists_false(self, test_region, aws_session, test_identity_pool_id):
-        """Test identity pool existence check when it doesn't exist."""
-        service = CognitoService(test_region, aws_session)
-
-        # Mock Cognito Identity client exception
-        with patch.object(service.cognito_identity_client, "describe_identity_pool") as mock_describe:
-            mock_describe.side_effect = Exception("ResourceNotFoundException")
-
-            exists = service.check_identity_pool_exists(test_identity_pool_id)
-
-            assert exists is False
+        # Listing goes through a paginator, so mock the pages it yields
+        cognito_service.cognito_idp_client.get_paginator.return_value.paginate.return_value = [_MOCK_USERS_RESPONSE]
+        success, users, message = cognito_service.list_users(test_user_pool_id)
+
+        assert success is True
+        assert isinstance(users, list)
+        assert len(users) == 2
+        assert users[0]["Username"] == "user1"
+
+    @pytest.mark.parametrize(
+        "mock_kwargs,expected",
+        [({"return_value": {"UserPool": {}}}, True), ({"side_effect": Exception("ResourceNotFoundException")}, False)],
+        ids=["exists", "missing"],
+    )
+    def test_check_user_pool_exists(self, cognito_service, test_user_pool_id, mock_kwargs, expected):
+        """Test user pool existence check when it exists and when it doesn't."""
+        # Mock Cognito IDP client response or exception
+        cognito_service.cognito_idp_client.describe_user_pool.configure_mock(**mock_kwargs)
+        exists = cognito_service.check_user_pool_exists(test_user_pool_id)
+
+        assert exists is expected
+
+    @pytest.mark.parametrize(
+        "mock_kwargs,expected",
+        [
+            ({"return_value": {"IdentityPool": {}}}, True),
+            ({"side_effect": Exception("ResourceNotFoundException")}, False),
+        ],
+        ids=["exists", "missing"],
+    )
+    def test_check_identity_pool_exists(self, cognito_service, test_identity_pool_id, mock_kwargs, expected):
+        """Test identity pool existence check when it exists and when it doesn't."""
+        # Mock Cognito Identity client response or exception
+        cognito_service.cognito_identity_client.describe_identity_pool.configure_mock(**mock_kwargs)
+        exists = cognito_service.check_identity_pool_exists(test_identity_pool_id)
+
+        assert exists is expected
 
     @pytest.mark.parametrize("environment", [None, "dev", "staging", "prod"])
-    @mock_aws
     def test_create_cognito_resources_with_different_environments(
-        self, test_region, aws_session, test_agent_name, environment
+        self, cognito_service, test_agent_name, environment, mock_cfn_success
     ):
         """Test Cognito resources creation with different environments."""
-        service = CognitoService(test_region, aws_session)
-
-        # Mock CloudFormation service
-        with patch.object(service.cfn_service, "create_update_stack") as mock_cfn:
-            mock_cfn.return_value = (True, "Stack created successfully")
-
-            with patch.object(service.cfn_service, "get_stack_outputs") as mock_outputs:
-                mock_outputs.return_value = [
-                    {"OutputKey": "UserPoolId", "OutputValue": "us-east-1_testpool123"},
-                    {"OutputKey": "IdentityPoolId", "OutputValue": "us-east-1:test-identity-pool-123"},
-                ]
+        # Mock CloudFormation stack outputs
+        mock_cfn_success.return_value = _MOCK_CFN_OUTPUTS_COGNITO
 
-                config = service.create_cognito_resources(agent_name=test_agent_name, environment=environment)
+        config = cognito_service.create_cognito_resources(agent_name=test_agent_name, environment=environment)
 
-                assert isinstance(config, CognitoConfig)
-                assert config.user_pool is not None
-                assert config.identity_pool is not None
+        assert isinstance(config, CognitoConfig)
+        assert config.user_pool is not None
+        assert config.identity_pool is not None
 
-    @pytest.mark.parametrize("allow_self_registration", [True, False])
-    @pytest.mark.parametrize("email_verification_required", [True, False])
-    @mock_aws
+    # Both flags are passed through as independent template parameters, so two cases cover each value of each flag
+    @pytest.mark.parametrize("allow_self_registration,email_verification_required", [(True, True), (False, False)])
     def test_create_cognito_resources_with_registration_options(
-        self, test_region, aws_session, test_agent_name, allow_self_registration, email_verification_required
+        self, cognito_service, test_agent_name, allow_self_registration, email_verification_required, mock_cfn_success
     ):
         """Test Cognito resources creation with different registration options."""
-        service = CognitoService(test_region, aws_session)
+        # Mock CloudFormation stack outputs
+        mock_cfn_success.return_value = _MOCK_CFN_OUTPUTS_COGNITO
 
-        # Mock CloudFormation service
-        with patch.object(service.cfn_service, "create_update_stack") as mock_cfn:
-            mock_cfn.return_value = (True, "Stack created successfully")
-
-            with patch.object(service.cfn_service, "get_stack_outputs") as mock_outputs:
-                mock_outputs.return_value = [
-                    {"OutputKey": "UserPoolId", "OutputValue": "us-east-1_testpool123"},
-                    {"OutputKey": "IdentityPoolId", "OutputValue": "us-east-1:test-identity-pool-123"},
-                ]
-
-                config = service.create_cognito_resources(
-                    agent_name=test_agent_name,
-                    allow_self_registration=allow_self_registration,
-                    email_verification_required=email_verification_required,
-                )
-
-                assert isinstance(config, CognitoConfig)
+        config = cognito_service.create_cognito_resources(
+            agent_name=test_agent_name,
+            allow_self_registration=allow_self_registration,
+            email_verification_required=email_verification_required,
+        )
+
+        assert isinstance(config, CognitoConfig)
@@ -0,0 +1,40 @@
+"""Unit tests for command security validation."""
+
+import pytest
+from agentcore_cli.utils.command_executor import _validate_command_security
+
+
+ECR_LOGIN = (
+    "aws ecr get-login-password --region us-east-1 | "
+    "docker login --username AWS --password-stdin 123456789012.dkr.ecr.us-east-1.amazonaws.com"
+)
+
+
+class TestValidateCommandSecurity:
+    """Test cases for command security validation."""
+
+    @pytest.mark.parametrize(
+        "cmd", [ECR_LOGIN, ["docker", "push", "repo:latest"], "docker build -t repo ."], ids=["ecr", "argv", "string"]
+    )
+    def test_allowed_commands(self, cmd):
+        """Test that whitelisted commands pass validation."""
+        assert _validate_command_security(cmd) == (True, "")
+
+    @pytest.mark.parametrize("suffix", ["; rm -rf /", " && rm -rf /"], ids=["semicolon", "and"])
+    def test_ecr_login_with_trailing_command_is_rejected(self, suffix):
+        """Test that nothing can be chained after the ECR login pipeline."""
+        is_valid, error = _validate_command_security(ECR_LOGIN + suffix)
+        assert is_valid is False
+        assert error == "Invalid ECR authentication command pattern"
+
+    def test_ecr_login_as_argv_list_is_rejected(self):
+        """Test that only shell strings may contain the ECR login pipe."""
+        is_valid, error = _validate_command_security(ECR_LOGIN.split())
+        assert is_valid is False
+        assert error == "Pipe character not allowed except for AWS ECR authentication"
+
+    def test_unbalanced_quotes_are_rejected(self):
+        """Test that commands shlex cannot tokenize are rejected rather than guessed at."""
+        is_valid, error = _validate_command_security("docker build -t 'repo .")
+        assert is_valid is False
+        assert error.startswith("Command could not be parsed:")
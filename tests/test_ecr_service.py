@@ -2,131 +2,159 @@
 
 import pytest
 from agentcore_cli.models.resources import ECRRepository
-from agentcore_cli.services.ecr import ECRService
-from moto import mock_aws
+from types import MappingProxyType
 from unittest.mock import patch
 
 
+# Canned, read-only client responses shared by the tests below
+_MOCK_REPOSITORIES_RESPONSE = MappingProxyType(
+    {
+        "repositories": [
+            {
+                "repositoryName": "test-repo-1",
+                "repositoryUri": "123456789012.dkr.ecr.us-east-1.amazonaws.com/test-repo-1",
+                "createdAt": "2024-01-01T00:00:00Z",
+            },
+            {
+                "repositoryName": "test-repo-2",
+                "repositoryUri": "123456789012.dkr.ecr.us-east-1.amazonaws.com/test-repo-2",
+                "createdAt": "2024-01-02T00:00:00Z",
+            },
+        ]
+    }
+)
+_MOCK_AUTH_TOKEN_RESPONSE = MappingProxyType(
+    {
+        "authorizationData": [
+            {
+                "authorizationToken": "base64-encoded-token",
+                "expiresAt": "2024-01-01T01:00:00Z",
+                "proxyEndpoint": "https://123456789012.dkr.ecr.us-east-1.amazonaws.com",
+            }
+        ]
+    }
+)
+_MOCK_CFN_OUTPUTS_ECR = (
+    MappingProxyType(
+        {"OutputKey": "RepositoryUri", "OutputValue": "123456789012.dkr.ecr.us-east-1.amazonaws.com/test-repo"}
+    ),
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients(ecr_service):
+    """Clear the responses and calls the previous test left on the shared client mocks."""
+    ecr_service.ecr_client.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def mock_cfn_success(ecr_service):
+    """Patch a successful stack deployment; tests set the stack outputs on the yielded get_stack_outputs mock."""
+    with (
+        patch.object(ecr_service.cfn_service, "create_update_stack", return_value=(True, "Stack created successfully")),
+        patch.object(ecr_service.cfn_service, "get_stack_outputs") as mock_outputs,
+    ):
+        yield mock_outputs
+
+
+@pytest.mark.usefixtures("mock_aws_module")
 class TestECRService:
-    """Test cases for ECRService."""
+    """Test cases for ECRService.
 
-    @mock_aws
-    def test_init(self, test_region, aws_session):
+    Every test runs inside the module-wide moto mock, so none needs its own mock_aws context.
+    """
+
+    def test_init(self, ecr_service, test_region, aws_session):
         """Test ECRService initialization."""
-        service = ECRService(test_region, aws_session)
-        assert service.region == test_region
-        assert service.session == aws_session
-        assert service.cfn_service is not None
-        assert service.ecr_client is not None
+        assert ecr_service.region == test_region
+        assert ecr_service.session == aws_session
+        assert ecr_service.cfn_service is not None
+        assert ecr_service.ecr_client is not None
 
-    @mock_aws
+    @pytest.mark.usefixtures("cached_boto3_session")
     def test_init_without_session(self, test_region):
         """Test ECRService initialization without session."""
+        from agentcore_cli.services.ecr import ECRService
+
         service = ECRService(test_region)
         assert service.region == test_region
         assert service.session is not None
         assert service.cfn_service is not None
         assert service.ecr_client is not None
 
-    @mock_aws
-    def test_create_repository_success(self, test_region, aws_session, test_repository_name):
+    def test_create_repository_success(self, ecr_service, test_region, test_repository_name, mock_cfn_success):
         """Test successful repository creation."""
-        service = ECRService(test_region, aws_session)
-
-        # Mock CloudFormation service
-        with patch.object(service.cfn_service, "create_update_stack") as mock_cfn:
-            mock_cfn.return_value = (True, "Stack created successfully")
-
-            with patch.object(service.cfn_service, "get_stack_outputs") as mock_outputs:
-                mock_outputs.return_value = [
-                    {
-                        "OutputKey": "RepositoryUri",
-                        "OutputValue": f"123456789012.dkr.ecr.{test_region}.amazonaws.com/{test_repository_name}",
-                    },
-                    {
-                        "OutputKey": "RepositoryArn",
-                        "OutputValue": f"arn:aws:ecr:{test_region}:123456789012:repository/{test_repository_name}",
-                    },
-                ]
-
-                success, repository, message = service.create_repository(
-                    repository_name=test_repository_name,
-                    environment="dev",
-                    image_scanning=True,
-                    lifecycle_policy_days=30,
-                    tags={"Environment": "dev"},
-                )
-
-                assert success is True
-                assert repository is not None
-                assert isinstance(repository, ECRRepository)
-                assert repository.name == test_repository_name
-                assert (
-                    repository.repository_uri
-                    == f"123456789012.dkr.ecr.{test_region}.amazonaws.com/{test_repository_name}"
-                )
-
-    @mock_aws
-    def test_create_repository_template_not_found(self, test_region, aws_session, test_repository_name):
+        # Mock CloudFormation stack outputs
+        mock_cfn_success.return_value = [
+            {
+                "OutputKey": "RepositoryUri",
+                "OutputValue": f"123456789012.dkr.ecr.{test_region}.amazonaws.com/{test_repository_name}",
+            },
+            {
+                "OutputKey": "RepositoryArn",
+                "OutputValue": f"arn:aws:ecr:{test_region}:123456789012:repository/{test_repository_name}",
+            },
+        ]
+
+        success, repository, message = ecr_service.create_repository(
+            repository_name=test_repository_name,
+            environment="dev",
+            image_scanning=True,
+            lifecycle_policy_days=30,
+            tags={"Environment": "dev"},
+        )
+
+        assert success is True
+        assert repository is not None
+        assert isinstance(repository, ECRRepository)
+        assert repository.name == test_repository_name
+        assert repository.repository_uri == f"123456789012.dkr.ecr.{test_region}.amazonaws.com/{test_repository_name}"
+
+    def test_create_repository_template_not_found(self, ecr_service, test_repository_name):
         """Test repository creation with missing template."""
-        service = ECRService(test_region, aws_session)
-
         # Mock template file not found
         with patch("pathlib.Path.exists", return_value=False):
-            success, repository, message = service.create_repository(test_repository_name)
+            success, repository, message = ecr_service.create_repository(test_repository_name)
 
             assert success is False
             assert repository is None
             assert "Template file not found" in message
 
-    @mock_aws
-    def test_create_repository_cfn_failure(self, test_region, aws_session, test_repository_name):
+    def test_create_repository_cfn_failure(self, ecr_service, test_repository_name):
         """Test repository creation with CloudFormation failure."""
-        service = ECRService(test_region, aws_session)
-
         # Mock CloudFormation failure
-        with patch.object(service.cfn_service, "create_update_stack") as mock_cfn:
+        with patch.object(ecr_service.cfn_service, "create_update_stack") as mock_cfn:
             mock_cfn.return_value = (False, "CloudFormation error")
 
-            success, repository, message = service.create_repository(test_repository_name)
+            success, repository, message = ecr_service.create_repository(test_repository_name)
 
             assert success is False
             assert repository is None
             assert "Failed to create/update ECR stack" in message
 
-    @mock_aws
-    def test_delete_repository_success(self, test_region, aws_session, test_repository_name):
+    def test_delete_repository_success(self, ecr_service, test_repository_name):
         """Test successful repository deletion."""
-        service = ECRService(test_region, aws_session)
-
         # Mock CloudFormation service
-        with patch.object(service.cfn_service, "delete_stack") as mock_delete:
+        with patch.object(ecr_service.cfn_service, "delete_stack") as mock_delete:
             mock_delete.return_value = (True, "Stack deleted successfully")
 
-            success, message = service.delete_repository(test_repository_name, environment="dev")
+            success, message = ecr_service.delete_repository(test_repository_name, environment="dev")
 
             assert success is True
             assert "deleted successfully" in message
 
-    @mock_aws
-    def test_delete_repository_force(self, test_region, aws_session, test_repository_name):
+    def test_delete_repository_force(self, ecr_service, test_repository_name):
         """Test repository deletion with force flag."""
-        service = ECRService(test_region, aws_session)
-
         # Mock ECR client for force deletion
-        with patch.object(service.ecr_client, "delete_repository") as mock_ecr_delete:
-            mock_ecr_delete.return_value = {}
+        ecr_service.ecr_client.delete_repository.return_value = {}
 
-            success, message = service.delete_repository(test_repository_name, environment="dev", force=True)
+        success, message = ecr_service.delete_repository(test_repository_name, environment="dev", force=True)
 
-            assert success is True
-            assert "deleted successfully" in message
+        assert success is True
+        assert "deleted successfully" in message
 
-    @mock_aws
-    def test_get_repository_success(self, test_region, aws_session, test_repository_name):
+    def test_get_repository_success(self, ecr_service, test_region, test_repository_name):
         """Test successful repository retrieval."""
-        service = ECRService(test_region, aws_session)
-
         # Mock ECR client response
         mock_response = {
             "repositories": [
@@ -141,158 +169,92 @@ class TestECRService:
             ]
         }
 
-        with patch.object(service.ecr_client, "describe_repositories", return_value=mock_response):
-            success, repository, message = service.get_repository(test_repository_name)
+        ecr_service.ecr_client.describe_repositories.return_value = mock_response
+        success, repository, message = ecr_service.get_repository(test_repository_name)
 
-            assert success is True
-            assert repository is not None
-            assert isinstance(repository, ECRRepository)
-            assert repository.name == test_repository_name
+        assert success is True
+        assert repository is not None
+        assert isinstance(repository, ECRRepository)
+        assert repository.name == test_repository_name
 
-    @mock_aws
-    def test_get_repository_not_found(self, test_region, aws_session, test_repository_name):
+    def test_get_repository_not_found(self, ecr_service, test_repository_name):
         """Test repository retrieval when not found."""
-        service = ECRService(test_region, aws_session)
-
         # Mock ECR client exception
-        with patch.object(service.ecr_client, "describe_repositories") as mock_describe:
-            mock_describe.side_effect = Exception("RepositoryNotFoundException")
+        ecr_service.ecr_client.describe_repositories.side_effect = Exception("RepositoryNotFoundException")
 
-            success, repository, message = service.get_repository(test_repository_name)
+        success, repository, message = ecr_service.get_repository(test_repository_name)
 
-            assert success is False
-            assert repository is None
-            assert "repositorynotfound" in message.lower() or "not found" in message.lower()
+        assert success is False
+        assert repository is None
+        assert "repositorynotfound" in message.lower() or "not found" in message.lower()
 
-    @mock_aws
-    def test_list_repositories_success(self, test_region, aws_session):
+    def test_list_repositories_success(self, ecr_service):
         """Test successful repository listing."""
-        service = ECRService(test_region, aws_session)
-
         # Mock ECR client response
-        mock_response = {
-            "repositories": [
-                {
-                    "repositoryName": "test-repo-1",
-                    "repositoryUri": f"123456789012.dkr.ecr.{test_region}.amazonaws.com/test-repo-1",
-                    "createdAt": "2024-01-01T00:00:00Z",
-                },
-                {
-                    "repositoryName": "test-repo-2",
-                    "repositoryUri": f"123456789012.dkr.ecr.{test_region}.amazonaws.com/test-repo-2",
-                    "createdAt": "2024-01-02T00:00:00Z",
-                },
-            ]
-        }
-
-        with patch.object(service.ecr_client, "describe_repositories", return_value=mock_response):
-            success, repositories, message = service.list_repositories()
+        ecr_service.ecr_client.describe_repositories.return_value = _MOCK_REPOSITORIES_RESPONSE
+        success, repositories, message = ecr_service.list_repositories()
 
-            assert success is True
-            assert isinstance(repositories, list)
-            assert len(repositories) == 2
-            assert repositories[0]["repositoryName"] == "test-repo-1"
+        assert success is True
+        assert isinstance(repositories, list)
+        assert len(repositories) == 2
+        assert repositories[0]["repositoryName"] == "test-repo-1"
 
-    @mock_aws
-    def test_get_auth_token_success(self, test_region, aws_session):
+    def test_get_auth_token_success(self, ecr_service):
         """Test successful auth token retrieval."""
-        service = ECRService(test_region, aws_session)
-
         # Mock ECR client response
-        mock_response = {
-            "authorizationData": [
-                {
-                    "authorizationToken": "base64-encoded-token",
-                    "expiresAt": "2024-01-01T01:00:00Z",
-                    "proxyEndpoint": f"https://123456789012.dkr.ecr.{test_region}.amazonaws.com",
-                }
-            ]
-        }
-
-        with patch.object(service.ecr_client, "get_authorization_token", return_value=mock_response):
-            success, auth_data, message = service.get_auth_token()
+        ecr_service.ecr_client.get_authorization_token.return_value = _MOCK_AUTH_TOKEN_RESPONSE
+        success, auth_data, message = ecr_service.get_auth_token()
 
-            assert success is True
-            assert auth_data is not None
-            assert "authorizationToken" in auth_data
-            assert "proxyEndpoint" in auth_data
+        assert success is True
+        assert auth_data is not None
+        assert "authorizationToken" in auth_data
+        assert "proxyEndpoint" in auth_data
 
-    @mock_aws
-    def test_set_lifecycle_policy_success(self, test_region, aws_session, test_repository_name):
+    def test_set_lifecycle_policy_success(self, ecr_service, test_repository_name):
         """Test successful lifecycle policy setting."""
-        service = ECRService(test_region, aws_session)
-
         # Mock ECR client response
-        with patch.object(service.ecr_client, "put_lifecycle_policy", return_value={}):
-            success, message = service.set_lifecycle_policy(test_repository_name, max_days=30)
+        ecr_service.ecr_client.put_lifecycle_policy.return_value = {}
+        success, message = ecr_service.set_lifecycle_policy(test_repository_name, max_days=30)
 
-            assert success is True
-            assert "policy set" in message.lower()
+        assert success is True
+        assert message == ecr_service.MSG_LIFECYCLE_POLICY_SET.format(repository_name=test_repository_name)
 
-    @mock_aws
-    def test_set_lifecycle_policy_failure(self, test_region, aws_session, test_repository_name):
+    def test_set_lifecycle_policy_failure(self, ecr_service, test_repository_name):
         """Test lifecycle policy setting failure."""
-        service = ECRService(test_region, aws_session)
-
         # Mock ECR client exception
-        with patch.object(service.ecr_client, "put_lifecycle_policy") as mock_policy:
-            mock_policy.side_effect = Exception("RepositoryNotFoundException")
+        ecr_service.ecr_client.put_lifecycle_policy.side_effect = Exception("RepositoryNotFoundException")
 
-            success, message = service.set_lifecycle_policy(test_repository_name, max_days=30)
+        success, message = ecr_service.set_lifecycle_policy(test_repository_name, max_days=30)
 
-            assert success is False
-            assert "Failed to set lifecycle policy" in message
+        assert success is False
+        assert "Failed to set lifecycle policy" in message
 
     @pytest.mark.parametrize("environment", [None, "dev", "staging", "prod"])
-    @mock_aws
     def test_create_repository_with_different_environments(
-        self, test_region, aws_session, test_repository_name, environment
+        self, ecr_service, test_repository_name, environment, mock_cfn_success
     ):
         """Test repository creation with different environments."""
-        service = ECRService(test_region, aws_session)
-
-        # Mock CloudFormation service
-        with patch.object(service.cfn_service, "create_update_stack") as mock_cfn:
-            mock_cfn.return_value = (True, "Stack created successfully")
+        # Mock CloudFormation stack outputs
+        mock_cfn_success.return_value = _MOCK_CFN_OUTPUTS_ECR
 
-            with patch.object(service.cfn_service, "get_stack_outputs") as mock_outputs:
-                mock_outputs.return_value = [
-                    {
-                        "OutputKey": "RepositoryUri",
-                        "OutputValue": f"123456789012.dkr.ecr.{test_region}.amazonaws.com/{test_repository_name}",
-                    }
-                ]
+        success, repository, message = ecr_service.create_repository(
+            repository_name=test_repository_name, environment=environment
+        )
 
-                success, repository, message = service.create_repository(
-                    repository_name=test_repository_name, environment=environment
-                )
-
-                assert success is True
-                assert repository is not None
+        assert success is True
+        assert repository is not None
 
     @pytest.mark.parametrize("image_scanning", [True, False])
-    @mock_aws
     def test_create_repository_with_scanning_options(
-        self, test_region, aws_session, test_repository_name, image_scanning
+        self, ecr_service, test_repository_name, image_scanning, mock_cfn_success
     ):
         """Test repository creation with different scanning options."""
-        service = ECRService(test_region, aws_session)
+        # Mock CloudFormation stack outputs
+        mock_cfn_success.return_value = _MOCK_CFN_OUTPUTS_ECR
 
-        # Mock CloudFormation service
-        with patch.object(service.cfn_service, "create_update_stack") as mock_cfn:
-            mock_cfn.return_value = (True, "Stack created successfully")
-
-            with patch.object(service.cfn_service, "get_stack_outputs") as mock_outputs:
-                mock_outputs.return_value = [
-                    {
-                        "OutputKey": "RepositoryUri",
-                        "OutputValue": f"123456789012.dkr.ecr.{test_region}.amazonaws.com/{test_repository_name}",
-                    }
-                ]
-
-                success, repository, message = service.create_repository(
-                    repository_name=test_repository_name, image_scanning=image_scanning
-                )
-
-                assert success is True
-                assert repository is not None
+        success, repository, message = ecr_service.create_repository(
+            repository_name=test_repository_name, image_scanning=image_scanning
+        )
+
+        assert success is True
+        assert repository is not None
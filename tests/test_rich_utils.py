@@ -0,0 +1,102 @@
+"""Unit tests for Rich output utilities."""
+
+import json
+import pytest
+from agentcore_cli.utils import rich_utils
+from agentcore_cli.utils.rich_utils import extract_response_content
+from datetime import datetime
+
+
+WIDE_INT_RESPONSE = '{"trace_id": 123456789012345678901234567}'
+
+
+class TestParseJson:
+    """Test cases for parsing response strings that might be JSON."""
+
+    def test_wide_integers_are_kept_exact(self):
+        """Test that integers wider than 64 bits are not turned into floats."""
+        data, is_json = rich_utils._parse_json(WIDE_INT_RESPONSE)
+        assert is_json is True
+        assert data == {"trace_id": 123456789012345678901234567}
+
+    def test_non_finite_numbers_are_json(self):
+        """Test that NaN and Infinity are parsed as JSON, as json.loads accepts them."""
+        data, is_json = rich_utils._parse_json('{"score": NaN, "limit": Infinity}')
+        assert is_json is True
+        assert data["limit"] == float("inf")
+
+    def test_plain_text_is_not_json(self):
+        """Test that plain text is returned unchanged."""
+        assert rich_utils._parse_json("Hello, world!") == ("Hello, world!", False)
+
+    def test_long_text_bypasses_cache(self):
+        """Test that long responses are parsed without being kept in the cache."""
+        text = json.dumps({"body": "x" * rich_utils._JSON_PARSE_CACHE_MAX_CHARS})
+        rich_utils._parse_json_cached.cache_clear()
+        rich_utils._parse_json(text)
+        assert rich_utils._parse_json_cached.cache_info().currsize == 0
+
+    def test_extract_response_content_keeps_wide_integers(self):
+        """Test that piped output reproduces wide integers digit for digit."""
+        output = extract_response_content(WIDE_INT_RESPONSE, prefer_markdown=False)
+        assert "123456789012345678901234567" in output
+        assert json.loads(output) == {"trace_id": 123456789012345678901234567}
+
+
+SERIALIZATION_SAMPLES = [
+    {"score": 1e-07, "large": 1e22, "ratio": 1.5},
+    {1: "int key", "nested": {"items": [1, 2.25, None, True]}},
+    {"text": "café ✓", "control": "tab\there\nnewline"},
+    ("tuple", 2**63, -(2**63)),
+    [],
+    {},
+]
+
+
+class TestDumpIndented:
+    """Test cases for serializing data with and without orjson installed."""
+
+    @pytest.mark.parametrize("data", SERIALIZATION_SAMPLES)
+    def test_output_matches_json_dumps(self, data):
+        """Test that output is identical to json.dumps whether or not orjson is used."""
+        assert rich_utils._dump_indented(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+    @pytest.mark.parametrize("data", SERIALIZATION_SAMPLES)
+    def test_output_is_the_same_without_orjson(self, data, monkeypatch):
+        """Test that rendered text does not depend on the optional extra."""
+        with_orjson = rich_utils._json_text(data).plain
+        monkeypatch.setattr(rich_utils, "orjson", None)
+        assert rich_utils._json_text(data).plain == with_orjson
+
+    def test_unsupported_types_raise_without_orjson_too(self, monkeypatch):
+        """Test that types json cannot serialize fail the same way in both modes."""
+        data = {"created": datetime(2025, 1, 1)}
+        with pytest.raises(TypeError):
+            rich_utils._dump_indented(data)
+        monkeypatch.setattr(rich_utils, "orjson", None)
+        with pytest.raises(TypeError):
+            rich_utils._dump_indented(data)
+
+
+class TestExtractResponseContent:
+    """Test cases for serializing dict responses for piped output."""
+
+    @pytest.mark.parametrize(
+        "response",
+        [{"trace_id": 123456789012345678901234567}, {"score": float("nan")}, {"text": "lone \ud800 surrogate"}],
+        ids=["wide-int", "nan", "lone-surrogate"],
+    )
+    def test_falls_back_to_json_dumps(self, response):
+        """Test that values orjson rejects or rewrites are serialized by json.dumps instead of repr."""
+        output = extract_response_content(response, prefer_markdown=False)
+        assert output == json.dumps(response, indent=2, ensure_ascii=False)
+
+    def test_wide_integers_round_trip(self):
+        """Test that wide integers come back digit for digit."""
+        output = extract_response_content({"trace_id": 123456789012345678901234567}, prefer_markdown=False)
+        assert json.loads(output) == {"trace_id": 123456789012345678901234567}
+
+    def test_nan_is_written_as_nan(self):
+        """Test that NaN is written as json does rather than as null."""
+        output = extract_response_content({"score": float("nan")}, prefer_markdown=False)
+        assert '"score": NaN' in output